@@ -6,20 +6,27 @@ Version 4.5 - Bugfix & Stability
 import sys
 import os
 import json
+import functools
+import hashlib
 import random
 import ctypes
 import argparse
+import time
 import logging
 import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QPushButton, QSlider, QLabel, QFrame, QSizePolicy, QShortcut,
     QFileDialog, QAction, QMessageBox, QDialog, QListWidget, QListWidgetItem,
-    QScrollArea
+    QScrollArea, QCheckBox, QLineEdit, QMenu
 )
-from PyQt5.QtCore import Qt, QTimer, QMimeData, QPoint, QPropertyAnimation, QEasingCurve, pyqtSignal
-from PyQt5.QtGui import QFont, QKeySequence, QIcon, QDrag, QPixmap, QPainter
+from PyQt5.QtCore import Qt, QTimer, QMimeData, QPoint, QPropertyAnimation, QEasingCurve, QFileInfo, QEvent, QUrl, pyqtSignal
+from PyQt5.QtGui import QFont, QKeySequence, QIcon, QDrag, QPixmap, QPainter, QDesktopServices
+
+log = logging.getLogger("rdm")
 
 # Session (Watch Together) support — imported lazily to keep solo mode clean
 try:
@@ -105,10 +112,11 @@ import vlc
 # Constants
 # ============================================================================
 
-VIDEO_EXTENSIONS = {
+# Lowercase, dot-prefixed; matched against the name's last suffix only
+VIDEO_EXTENSIONS = frozenset({
     '.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', 
     '.webm', '.m4v', '.mpeg', '.mpg', '.3gp', '.ts', '.mts'
-}
+})
 
 # Modern Dark Color Palette
 COLORS = {
@@ -128,6 +136,17 @@ COLORS = {
     'border': '#30363d',
 }
 
+# Keybind name -> Qt key, built once (config stores keybinds by name)
+_KEY_MAP = {
+    "Space": Qt.Key_Space, "Return": Qt.Key_Return, "Escape": Qt.Key_Escape,
+    "Backspace": Qt.Key_Backspace, "Delete": Qt.Key_Delete, "Tab": Qt.Key_Tab,
+    "Left": Qt.Key_Left, "Right": Qt.Key_Right, "Up": Qt.Key_Up, "Down": Qt.Key_Down,
+    "Period": Qt.Key_Period, "Comma": Qt.Key_Comma,
+    "Home": Qt.Key_Home, "End": Qt.Key_End, "PageUp": Qt.Key_PageUp, "PageDown": Qt.Key_PageDown,
+}
+_KEY_MAP.update({c: getattr(Qt, f"Key_{c}") for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"})
+_KEY_MAP.update({f"F{i}": getattr(Qt, f"Key_F{i}") for i in range(1, 13)})
+
 # ============================================================================
 # Configuration Management
 # ============================================================================
@@ -190,13 +209,26 @@ class ConfigManager:
         """Debounce save requests"""
         self._save_timer.start(500)  # 500ms debounce
 
+    def flush(self):
+        """Write any pending debounced save immediately"""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._do_save()
+
     def _do_save(self):
         """Actually save current config to JSON file"""
         try:
             with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=4)
+                json.dump(self.config, f, indent=4, default=self._encode)
         except Exception as e:
-            logging.getLogger("rdm").warning(f"Failed to save config: {e}")
+            log.warning("Failed to save config: %s", e)
+
+    @staticmethod
+    def _encode(value):
+        """JSON fallback: set-valued keys are written as sorted lists"""
+        if isinstance(value, (set, frozenset)):
+            return sorted(value)
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
 
     def get(self, key):
         return self.config.get(key)
@@ -205,6 +237,136 @@ class ConfigManager:
         self.config[key] = value
         self.save_config()
 
+    def get_set(self, key):
+        """Return a list-valued key as a live set, converting it in place on first use.
+        Mutate it through add_to_set/remove_from_set so the change gets saved."""
+        value = self.config.get(key)
+        if not isinstance(value, set):
+            value = set(value or [])
+            self.config[key] = value
+        return value
+
+    def add_to_set(self, key, value):
+        """Add one item to a list-valued key; saved (sorted) on the next debounced write"""
+        items = self.get_set(key)
+        if value not in items:
+            items.add(value)
+            self.save_config()
+
+    def remove_from_set(self, key, value):
+        """Remove one item from a list-valued key"""
+        items = self.get_set(key)
+        if value in items:
+            items.remove(value)
+            self.save_config()
+
+# ============================================================================
+# Library Scanning
+# ============================================================================
+
+SCAN_CACHE_FILE = Path("scan_cache.json")
+QUEUE_STATE_FILE = Path("queue_state.json")  # Play queue kept across launches
+SCAN_WORKERS = 8  # Parallel top-level subdirectory walks
+
+
+def load_scan_cache():
+    """Load the per-directory scan cache (empty if missing or unreadable)"""
+    if SCAN_CACHE_FILE.exists():
+        try:
+            with open(SCAN_CACHE_FILE, 'r') as f:
+                cache = json.load(f)
+            if isinstance(cache, dict):
+                # Drop malformed entries so the scanners can index them blindly
+                return {
+                    path: entry for path, entry in cache.items()
+                    if isinstance(entry, dict)
+                    and isinstance(entry.get("files"), list)
+                    and isinstance(entry.get("dirs"), list)
+                    and "mtime" in entry
+                }
+        except Exception:
+            pass
+    return {}
+
+
+def save_scan_cache(cache):
+    """Persist the per-directory scan cache"""
+    try:
+        with open(SCAN_CACHE_FILE, 'w') as f:
+            json.dump(cache, f)
+    except Exception as e:
+        log.warning("Failed to save scan cache: %s", e)
+
+
+def _scan_dir(dirpath, cache):
+    """List one directory, reusing the cached entry if its mtime is unchanged.
+    Returns {"mtime", "files", "dirs"} (bare names), or None if unreadable."""
+    try:
+        mtime = os.stat(dirpath).st_mtime
+    except OSError:
+        return None
+    entry = cache.get(dirpath)
+    if entry and entry.get("mtime") == mtime:
+        return entry
+    names, subdirs = [], []
+    try:
+        with os.scandir(dirpath) as it:
+            for e in it:
+                try:
+                    if e.is_dir(follow_symlinks=False):
+                        subdirs.append(e.name)
+                        continue
+                except OSError:
+                    continue
+                name = e.name
+                dot = name.rfind('.')
+                if dot != -1 and name[dot:].lower() in VIDEO_EXTENSIONS:
+                    names.append(name)
+    except OSError:
+        return None
+    return {"mtime": mtime, "files": names, "dirs": subdirs}
+
+
+def _scan_tree(top, cache):
+    """Walk `top` depth-first with an explicit stack. Returns (files, new_cache)."""
+    files = []
+    new_cache = {}
+    stack = [top]
+    while stack:
+        dirpath = stack.pop()
+        entry = _scan_dir(dirpath, cache)
+        if entry is None:
+            continue
+        new_cache[dirpath] = entry
+        files.extend(os.path.join(dirpath, name) for name in entry["files"])
+        stack.extend(os.path.join(dirpath, name) for name in entry["dirs"])
+    return files, new_cache
+
+
+def scan_video_files(root, cache):
+    """Recursively collect video files under `root`.
+
+    `cache` maps directory path -> {"mtime", "files", "dirs"}. A directory
+    whose mtime is unchanged is not re-listed, so an unchanged library costs
+    one stat per directory. Top-level subdirectories are walked in parallel,
+    which helps on latency-bound drives (SMB/NFS/USB).
+    Returns (files, new_cache).
+    """
+    root = str(Path(root))  # Normalized so paths match the old rglob output
+    entry = _scan_dir(root, cache)
+    if entry is None:
+        return [], {}
+    files = [os.path.join(root, name) for name in entry["files"]]
+    new_cache = {root: entry}
+    subdirs = [os.path.join(root, name) for name in entry["dirs"]]
+    if subdirs:
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+            for sub_files, sub_cache in pool.map(lambda d: _scan_tree(d, cache), subdirs):
+                files.extend(sub_files)
+                new_cache.update(sub_cache)
+    return files, new_cache
+
+
 class BlockedListDialog(QDialog):
     """Dialog to manage blocked clips"""
     
@@ -212,7 +374,7 @@ class BlockedListDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Manage Blocked Clips")
         self.setMinimumSize(500, 400)
-        self.blocked_clips = sorted(list(blocked_clips))
+        self.blocked_clips = sorted(blocked_clips)
         self.removed_clips = set()
         
         layout = QVBoxLayout(self)
@@ -781,6 +943,28 @@ class SpeedButton(QPushButton):
     """Custom button that changes playback speed on scroll"""
     
     SPEEDS = [0.25, 0.5, 0.75, 1.0, 1.25, 1.5, 2.0]
+
+    STYLE = f"""
+        QPushButton {{
+            background-color: {COLORS['bg_light']};
+            color: {COLORS['text_primary']};
+            font-size: 12px;
+            font-weight: 500;
+            border: 1px solid {COLORS['border']};
+            border-radius: 8px;
+            padding: 10px 14px;
+        }}
+        QPushButton:hover {{
+            background-color: {COLORS['border']};
+            border-color: {COLORS['text_muted']};
+        }}
+        QPushButton:pressed {{ background-color: {COLORS['bg_medium']}; }}
+        QPushButton:checked {{
+            background-color: {COLORS['accent_blue']};
+            border-color: {COLORS['accent_blue']};
+        }}
+        QPushButton:checked:hover {{ background-color: {COLORS['accent_blue_hover']}; }}
+    """
     
     def __init__(self, text, parent=None):
         super().__init__(text, parent)
@@ -791,27 +975,7 @@ class SpeedButton(QPushButton):
         self._apply_style()
         
     def _apply_style(self):
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['bg_light']};
-                color: {COLORS['text_primary']};
-                font-size: 12px;
-                font-weight: 500;
-                border: 1px solid {COLORS['border']};
-                border-radius: 8px;
-                padding: 10px 14px;
-            }}
-            QPushButton:hover {{
-                background-color: {COLORS['border']};
-                border-color: {COLORS['text_muted']};
-            }}
-            QPushButton:pressed {{ background-color: {COLORS['bg_medium']}; }}
-            QPushButton:checked {{
-                background-color: {COLORS['accent_blue']};
-                border-color: {COLORS['accent_blue']};
-            }}
-            QPushButton:checked:hover {{ background-color: {COLORS['accent_blue_hover']}; }}
-        """)
+        self.setStyleSheet(self.STYLE)
         
     def wheelEvent(self, event):
         """Handle mouse wheel to change speed"""
@@ -851,6 +1015,86 @@ class SpeedButton(QPushButton):
 
 class StyledButton(QPushButton):
     """Custom styled button with hover effects"""
+
+    # Built once at class creation instead of per instance
+    STYLES = {
+        'primary': f"""
+            QPushButton {{
+                background-color: {COLORS['accent_green']};
+                color: {COLORS['text_primary']};
+                font-size: 14px;
+                font-weight: 600;
+                border: none;
+                border-radius: 8px;
+                padding: 10px 20px;
+            }}
+            QPushButton:hover {{ background-color: {COLORS['accent_green_hover']}; }}
+            QPushButton:pressed {{ background-color: #196c2e; }}
+            QPushButton:disabled {{
+                background-color: {COLORS['bg_light']};
+                color: {COLORS['text_muted']};
+            }}
+        """,
+        'secondary': f"""
+            QPushButton {{
+                background-color: {COLORS['accent_orange']};
+                color: {COLORS['bg_dark']};
+                font-size: 12px;
+                font-weight: 600;
+                border: none;
+                border-radius: 8px;
+                padding: 10px 14px;
+            }}
+            QPushButton:hover {{ background-color: {COLORS['accent_orange_hover']}; }}
+            QPushButton:pressed {{ background-color: #b87d14; }}
+            QPushButton:disabled {{
+                background-color: {COLORS['bg_light']};
+                color: {COLORS['text_muted']};
+            }}
+        """,
+        'toggle': f"""
+            QPushButton {{
+                background-color: {COLORS['bg_light']};
+                color: {COLORS['text_primary']};
+                font-size: 12px;
+                font-weight: 500;
+                border: 1px solid {COLORS['border']};
+                border-radius: 8px;
+                padding: 10px 14px;
+            }}
+            QPushButton:hover {{
+                background-color: {COLORS['border']};
+                border-color: {COLORS['text_muted']};
+            }}
+            QPushButton:pressed {{ background-color: {COLORS['bg_medium']}; }}
+            QPushButton:checked {{
+                background-color: {COLORS['accent_blue']};
+                border-color: {COLORS['accent_blue']};
+            }}
+            QPushButton:checked:hover {{ background-color: {COLORS['accent_blue_hover']}; }}
+        """,
+        'default': f"""
+            QPushButton {{
+                background-color: {COLORS['bg_light']};
+                color: {COLORS['text_primary']};
+                font-size: 12px;
+                font-weight: 500;
+                border: 1px solid {COLORS['border']};
+                border-radius: 8px;
+                padding: 10px 14px;
+            }}
+            QPushButton:hover {{
+                background-color: {COLORS['border']};
+                border-color: {COLORS['text_muted']};
+            }}
+            QPushButton:pressed {{ background-color: {COLORS['bg_medium']}; }}
+            QPushButton:disabled {{
+                background-color: {COLORS['bg_medium']};
+                color: {COLORS['text_muted']};
+                border-color: {COLORS['bg_light']};
+            }}
+        """
+    }
     
     def __init__(self, text, color='default', parent=None):
         super().__init__(text, parent)
@@ -860,91 +1104,24 @@ class StyledButton(QPushButton):
         self._apply_style()
         
     def _apply_style(self):
-        styles = {
-            'primary': f"""
-                QPushButton {{
-                    background-color: {COLORS['accent_green']};
-                    color: {COLORS['text_primary']};
-                    font-size: 14px;
-                    font-weight: 600;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 10px 20px;
-                }}
-                QPushButton:hover {{ background-color: {COLORS['accent_green_hover']}; }}
-                QPushButton:pressed {{ background-color: #196c2e; }}
-                QPushButton:disabled {{
-                    background-color: {COLORS['bg_light']};
-                    color: {COLORS['text_muted']};
-                }}
-            """,
-            'secondary': f"""
-                QPushButton {{
-                    background-color: {COLORS['accent_orange']};
-                    color: {COLORS['bg_dark']};
-                    font-size: 12px;
-                    font-weight: 600;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 10px 14px;
-                }}
-                QPushButton:hover {{ background-color: {COLORS['accent_orange_hover']}; }}
-                QPushButton:pressed {{ background-color: #b87d14; }}
-                QPushButton:disabled {{
-                    background-color: {COLORS['bg_light']};
-                    color: {COLORS['text_muted']};
-                }}
-            """,
-            'toggle': f"""
-                QPushButton {{
-                    background-color: {COLORS['bg_light']};
-                    color: {COLORS['text_primary']};
-                    font-size: 12px;
-                    font-weight: 500;
-                    border: 1px solid {COLORS['border']};
-                    border-radius: 8px;
-                    padding: 10px 14px;
-                }}
-                QPushButton:hover {{
-                    background-color: {COLORS['border']};
-                    border-color: {COLORS['text_muted']};
-                }}
-                QPushButton:pressed {{ background-color: {COLORS['bg_medium']}; }}
-                QPushButton:checked {{
-                    background-color: {COLORS['accent_blue']};
-                    border-color: {COLORS['accent_blue']};
-                }}
-                QPushButton:checked:hover {{ background-color: {COLORS['accent_blue_hover']}; }}
-            """,
-            'default': f"""
-                QPushButton {{
-                    background-color: {COLORS['bg_light']};
-                    color: {COLORS['text_primary']};
-                    font-size: 12px;
-                    font-weight: 500;
-                    border: 1px solid {COLORS['border']};
-                    border-radius: 8px;
-                    padding: 10px 14px;
-                }}
-                QPushButton:hover {{
-                    background-color: {COLORS['border']};
-                    border-color: {COLORS['text_muted']};
-                }}
-                QPushButton:pressed {{ background-color: {COLORS['bg_medium']}; }}
-                QPushButton:disabled {{
-                    background-color: {COLORS['bg_medium']};
-                    color: {COLORS['text_muted']};
-                    border-color: {COLORS['bg_light']};
-                }}
-            """
-        }
-        self.setStyleSheet(styles.get(self.color_scheme, styles['default']))
+        self.setStyleSheet(self.STYLES.get(self.color_scheme, self.STYLES['default']))
 
 
 # ============================================================================
 # Session Panel (Watch Together)
 # ============================================================================
 
+# Activity feed templates for recurring remote events (usernames arrive
+# interned from SessionClient, so each line is a single format call)
+_FMT_PLAY = "▶ {} pressed play"
+_FMT_PAUSE = "⏸ {} paused"
+_FMT_SEEK = "⏩ {} seeked"
+_FMT_SPEED = "⚡ {} set speed {}x"
+_FMT_SHARED = "🎬 {} shared {}"
+_FMT_JOINED = "👋 {} joined"
+_FMT_LEFT = "👋 {} left"
+_FMT_KICKED = "🚫 {} was kicked by {}"
+
 class SessionPanel(QFrame):
     """Collapsible right-side panel for Watch Together session management."""
 
@@ -967,12 +1144,22 @@ class SessionPanel(QFrame):
         """)
 
         self._test_result_signal.connect(self._show_test_result)
-        self._setup_ui()
+        self._session_ui_built = False  # session_section is built on first room join
 
-    def _setup_ui(self):
+        # Delayed UI resets (clearing status text etc.) share one timer instead
+        # of spawning a QTimer per event: deque of (expiry, callback)
+        self._deferred = deque()
+        self._defer_timer = QTimer(self)
+        self._defer_timer.setInterval(250)
+        self._defer_timer.timeout.connect(self._tick_deferred)
+
+        self._setup_connect_ui()
+
+    def _setup_connect_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
         layout.setSpacing(8)
+        self._panel_layout = layout
 
         # Header
         header = QLabel("🎬  Watch Together")
@@ -1015,17 +1202,13 @@ class SessionPanel(QFrame):
         self.connection_status.setWordWrap(True)
         conn_layout.addWidget(self.connection_status)
 
-        conn_layout.addWidget(self._make_separator())
-
         # Username
-        conn_layout.addWidget(self._make_label("Username"))
+        conn_layout.addWidget(self._make_label("Username", section=True))
         self.username_input = self._make_input(session_cfg.get("username", ""), "Your display name")
         conn_layout.addWidget(self.username_input)
 
-        conn_layout.addWidget(self._make_separator())
-
         # Create Room
-        conn_layout.addWidget(self._make_label("Create Room"))
+        conn_layout.addWidget(self._make_label("Create Room", section=True))
         self.create_pw_input = self._make_input("", "Room password", password=True)
         conn_layout.addWidget(self.create_pw_input)
         self.create_btn = QPushButton("🏠  Create Room")
@@ -1034,10 +1217,8 @@ class SessionPanel(QFrame):
         self.create_btn.clicked.connect(self._create_room)
         conn_layout.addWidget(self.create_btn)
 
-        conn_layout.addWidget(self._make_separator())
-
         # Join Room
-        conn_layout.addWidget(self._make_label("Join Room"))
+        conn_layout.addWidget(self._make_label("Join Room", section=True))
         self.join_code_input = self._make_input(session_cfg.get("last_room_code", ""), "Room code")
         conn_layout.addWidget(self.join_code_input)
         self.join_pw_input = self._make_input("", "Room password", password=True)
@@ -1050,7 +1231,16 @@ class SessionPanel(QFrame):
 
         layout.addWidget(self.connect_section)
 
-        # ---- Active Session Section (hidden until connected) ----
+        layout.addStretch()
+
+    def _setup_session_ui(self):
+        """Build the active-session widgets. Deferred until a room is first
+        created or joined, since most launches never open one."""
+        if self._session_ui_built:
+            return
+        self._session_ui_built = True
+
+        # ---- Active Session Section ----
         self.session_section = QWidget()
         self.session_section.setStyleSheet("border: none;")
         self.session_section.setVisible(False)
@@ -1092,7 +1282,6 @@ class SessionPanel(QFrame):
         sess_layout.addWidget(self.ping_label)
 
         # Shared random pool toggle (host only)
-        from PyQt5.QtWidgets import QCheckBox
         self.shared_pool_cb = QCheckBox("🎲 Shared random pool")
         self.shared_pool_cb.setToolTip("When on, Random Clip picks from a random user's gallery")
         self.shared_pool_cb.setStyleSheet(f"""
@@ -1117,10 +1306,8 @@ class SessionPanel(QFrame):
         self.shared_pool_cb.toggled.connect(self._on_shared_pool_toggled)
         sess_layout.addWidget(self.shared_pool_cb)
 
-        sess_layout.addWidget(self._make_separator())
-
         # Users list
-        sess_layout.addWidget(self._make_label("Connected Users"))
+        sess_layout.addWidget(self._make_label("Connected Users", section=True))
         self.users_list = QListWidget()
         self.users_list.setMaximumHeight(120)
         self.users_list.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -1137,10 +1324,8 @@ class SessionPanel(QFrame):
         """)
         sess_layout.addWidget(self.users_list)
 
-        sess_layout.addWidget(self._make_separator())
-
         # Activity feed
-        sess_layout.addWidget(self._make_label("Activity"))
+        sess_layout.addWidget(self._make_label("Activity", section=True))
         self.activity_feed = QListWidget()
         self.activity_feed.setMaximumHeight(100)
         self.activity_feed.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
@@ -1162,7 +1347,7 @@ class SessionPanel(QFrame):
         """)
         sess_layout.addWidget(self.activity_feed)
 
-        sess_layout.addWidget(self._make_separator())
+        sess_layout.addSpacing(4)
 
         # Share clip button (also drop hint)
         self.share_btn = QPushButton("📤  Share Current Clip")
@@ -1183,15 +1368,16 @@ class SessionPanel(QFrame):
         self.progress_label.setWordWrap(True)
         sess_layout.addWidget(self.progress_label)
 
-        sess_layout.addWidget(self._make_separator())
-
-        # Now playing
+        # Now playing (top border doubles as the section separator)
         self.now_playing_label = QLabel("Nothing playing")
-        self.now_playing_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 11px; border: none;")
+        self.now_playing_label.setStyleSheet(
+            f"color: {COLORS['text_secondary']}; font-size: 11px; border: none; "
+            f"border-top: 1px solid {COLORS['border']}; padding-top: 6px;"
+        )
         self.now_playing_label.setWordWrap(True)
         sess_layout.addWidget(self.now_playing_label)
 
-        sess_layout.addWidget(self._make_separator())
+        sess_layout.addSpacing(4)
 
         # Disconnect button
         self.disconnect_btn = QPushButton("❌  Disconnect")
@@ -1201,19 +1387,21 @@ class SessionPanel(QFrame):
         sess_layout.addWidget(self.disconnect_btn)
 
         sess_layout.addStretch()
-        layout.addWidget(self.session_section)
-
-        layout.addStretch()
+        # Insert above the trailing stretch of the panel layout
+        self._panel_layout.insertWidget(self._panel_layout.count() - 1, self.session_section)
 
     # ---- Helpers ----
 
-    def _make_label(self, text):
+    def _make_label(self, text, section=False):
+        """Field label; section headers draw their own top border as a separator."""
         lbl = QLabel(text)
-        lbl.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 11px; border: none;")
+        style = f"color: {COLORS['text_secondary']}; font-size: 11px; border: none;"
+        if section:
+            style += f" border-top: 1px solid {COLORS['border']}; padding-top: 6px;"
+        lbl.setStyleSheet(style)
         return lbl
 
     def _make_input(self, value, placeholder, password=False):
-        from PyQt5.QtWidgets import QLineEdit
         inp = QLineEdit(value)
         inp.setPlaceholderText(placeholder)
         if password:
@@ -1233,19 +1421,39 @@ class SessionPanel(QFrame):
         """)
         return inp
 
-    def _make_separator(self):
-        sep = QFrame()
-        sep.setFrameShape(QFrame.HLine)
-        sep.setStyleSheet(f"background-color: {COLORS['border']}; border: none; max-height: 1px;")
-        return sep
+    # ---- Deferred UI Resets ----
+
+    def _defer(self, delay, callback):
+        """Run `callback` after roughly `delay` seconds (250ms resolution)."""
+        self._deferred.append((time.monotonic() + delay, callback))
+        if not self._defer_timer.isActive():
+            self._defer_timer.start()
+
+    def _tick_deferred(self):
+        now = time.monotonic()
+        due = [cb for expiry, cb in self._deferred if expiry <= now]
+        if due:
+            self._deferred = deque(item for item in self._deferred if item[0] > now)
+            for cb in due:
+                cb()
+        if not self._deferred:
+            self._defer_timer.stop()
+
+    def _clear_progress(self):
+        if self._session_ui_built:
+            self.progress_label.setText("")
+
+    def _reset_copy_btn(self):
+        self.copy_code_btn.setText("📋 Copy")
 
     # ---- Activity Feed ----
 
     _VIDEO_EXTENSIONS = {'.mp4', '.mkv', '.avi', '.mov', '.webm', '.flv', '.wmv', '.m4v', '.ts', '.mpg', '.mpeg'}
+    _VIDEO_EXTENSIONS_TUPLE = tuple(_VIDEO_EXTENSIONS)  # for str.endswith
 
     def add_activity(self, text):
         """Add an entry to the activity feed (max 50 items, auto-scrolls)."""
-        if not hasattr(self, 'activity_feed'):
+        if not self._session_ui_built:
             return
         self.activity_feed.addItem(text)
         while self.activity_feed.count() > 50:
@@ -1258,8 +1466,7 @@ class SessionPanel(QFrame):
         if event.mimeData().hasUrls():
             for url in event.mimeData().urls():
                 if url.isLocalFile():
-                    ext = os.path.splitext(url.toLocalFile())[1].lower()
-                    if ext in self._VIDEO_EXTENSIONS:
+                    if url.toLocalFile().lower().endswith(self._VIDEO_EXTENSIONS_TUPLE):
                         event.acceptProposedAction()
                         return
         event.ignore()
@@ -1277,8 +1484,7 @@ class SessionPanel(QFrame):
         for url in event.mimeData().urls():
             if url.isLocalFile():
                 filepath = url.toLocalFile()
-                ext = os.path.splitext(filepath)[1].lower()
-                if ext in self._VIDEO_EXTENSIONS:
+                if filepath.lower().endswith(self._VIDEO_EXTENSIONS_TUPLE):
                     event.acceptProposedAction()
                     self._share_dropped_file(filepath)
                     return
@@ -1287,9 +1493,10 @@ class SessionPanel(QFrame):
     def _share_dropped_file(self, filepath):
         """Upload a dropped video file to the session."""
         if not self.session_client or not self.session_client.is_connected:
-            self.progress_label.setText("Not connected — can't share")
+            status = self.progress_label if self._session_ui_built else self.connection_status
+            status.setText("Not connected — can't share")
             return
-        filename = os.path.basename(filepath)
+        filename = QFileInfo(filepath).fileName()
         self.progress_label.setText(f"⏳ Uploading {filename}...")
         self.add_activity(f"📤 You shared {filename}")
         self.session_client.upload_and_play(filepath)
@@ -1430,15 +1637,15 @@ class SessionPanel(QFrame):
             if clipboard:
                 clipboard.setText(self.session_client.room_code)
             self.copy_code_btn.setText("✅ Copied!")
-            copy_btn = self.copy_code_btn
-            QTimer.singleShot(1500, lambda: copy_btn.setText("📋 Copy"))
+            self._defer(1.5, self._reset_copy_btn)
 
     def _share_current_clip(self):
         if not self.session_client or not self.session_client.is_connected:
             self.progress_label.setText("Not connected")
             return
         player = self._player
-        if player and player.current_video and os.path.exists(player.current_video):
+        # Existence is checked by the upload worker thread, not on the GUI thread
+        if player and player.current_video:
             self.progress_label.setText("⏳ Uploading...")
             self.session_client.upload_and_play(player.current_video)
         else:
@@ -1487,43 +1694,51 @@ class SessionPanel(QFrame):
     # ---- Handlers ----
 
     def _on_activity_play(self, position, username):
-        self.add_activity(f"▶ {username} pressed play")
+        self.add_activity(_FMT_PLAY.format(username))
         if self._player:
             self._player._on_remote_play(position, username)
 
     def _on_activity_pause(self, position, username):
-        self.add_activity(f"⏸ {username} paused")
+        self.add_activity(_FMT_PAUSE.format(username))
         if self._player:
             self._player._on_remote_pause(position, username)
 
     def _on_activity_seek(self, position, username):
-        self.add_activity(f"⏩ {username} seeked")
+        self.add_activity(_FMT_SEEK.format(username))
         if self._player:
             self._player._on_remote_seek(position, username)
 
     def _on_activity_speed(self, speed, username):
-        self.add_activity(f"⚡ {username} set speed {speed}x")
+        self.add_activity(_FMT_SPEED.format(username, speed))
         if self._player:
             self._player._on_remote_speed(speed, username)
 
     def _on_activity_play_video(self, video_id, filename, username):
-        self.add_activity(f"🎬 {username} shared {filename}")
+        self.add_activity(_FMT_SHARED.format(username, filename))
         if self._player:
             self._player._on_remote_play_video(video_id, filename, username)
 
     def _on_connected(self):
         self.connection_status.setText("✅ WebSocket connected")
         self.connection_status.setStyleSheet(f"color: {COLORS['accent_green']}; font-size: 10px; border: none;")
+        if self._player:
+            self._player._invalidate_session_client()
 
     def _on_room_created(self, room_code, user_id):
-        self.room_info_label.setText(f"Room: {room_code}")
-        self.connect_section.setVisible(False)
-        self.session_section.setVisible(True)
-        self.users_list.clear()
-        self.activity_feed.clear()
-        username = self.username_input.text().strip()
-        self.users_list.addItem(f"👑 {username} (you)")
-        self.add_activity(f"🏠 Room {room_code} created")
+        self._setup_session_ui()
+        # Coalesce the section swap into a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self.room_info_label.setText(f"Room: {room_code}")
+            self.connect_section.setVisible(False)
+            self.session_section.setVisible(True)
+            self.users_list.clear()
+            self.activity_feed.clear()
+            username = self.username_input.text().strip()
+            self.users_list.addItem(f"👑 {username} (you)")
+            self.add_activity(f"🏠 Room {room_code} created")
+        finally:
+            self.setUpdatesEnabled(True)
         # Update connection dot
         if self._player:
             self._player._update_session_dot(True)
@@ -1535,16 +1750,21 @@ class SessionPanel(QFrame):
         else:
             room_code = (self.session_client.room_code if self.session_client else "") or ""
             users = []
-        self.room_info_label.setText(f"Room: {room_code}")
-        self.connect_section.setVisible(False)
-        self.session_section.setVisible(True)
-        # Only clear activity if this is the first join (not a reconnect)
-        was_reconnect = self.activity_feed.count() > 0
-        self._update_users_list(users)
-        if was_reconnect:
-            self.add_activity("🔄 Reconnected")
-        else:
-            self.add_activity(f"🔗 Joined room {room_code}")
+        self._setup_session_ui()
+        self.setUpdatesEnabled(False)
+        try:
+            self.room_info_label.setText(f"Room: {room_code}")
+            self.connect_section.setVisible(False)
+            self.session_section.setVisible(True)
+            # Only clear activity if this is the first join (not a reconnect)
+            was_reconnect = self.activity_feed.count() > 0
+            self._update_users_list(users)
+            if was_reconnect:
+                self.add_activity("🔄 Reconnected")
+            else:
+                self.add_activity(f"🔗 Joined room {room_code}")
+        finally:
+            self.setUpdatesEnabled(True)
         # Update connection dot
         if self._player:
             self._player._update_session_dot(True)
@@ -1558,21 +1778,23 @@ class SessionPanel(QFrame):
 
     def _on_user_joined(self, username, users):
         self._update_users_list(users)
-        self.add_activity(f"👋 {username} joined")
-        self.progress_label.setText(f"👋 {username} joined")
-        QTimer.singleShot(3000, lambda: self.progress_label.setText(""))
+        line = _FMT_JOINED.format(username)
+        self.add_activity(line)
+        self.progress_label.setText(line)
+        self._defer(3.0, self._clear_progress)
 
     def _on_user_left(self, username, users):
         self._update_users_list(users)
-        self.add_activity(f"👋 {username} left")
-        self.progress_label.setText(f"👋 {username} left")
-        QTimer.singleShot(3000, lambda: self.progress_label.setText(""))
+        line = _FMT_LEFT.format(username)
+        self.add_activity(line)
+        self.progress_label.setText(line)
+        self._defer(3.0, self._clear_progress)
 
     def _on_user_kicked(self, username, kicked_by, users):
         self._update_users_list(users)
-        self.add_activity(f"🚫 {username} was kicked by {kicked_by}")
+        self.add_activity(_FMT_KICKED.format(username, kicked_by))
         self.progress_label.setText(f"🚫 {username} was kicked")
-        QTimer.singleShot(3000, lambda: self.progress_label.setText(""))
+        self._defer(3.0, self._clear_progress)
 
     def _on_kicked(self, message):
         """We were kicked from the room."""
@@ -1580,14 +1802,20 @@ class SessionPanel(QFrame):
         self._show_disconnected(message)
 
     def _update_users_list(self, users):
-        self.users_list.clear()
         self._users_data = users  # Store for kick context menu
+        items = []
         for u in users:
             uid = u.get("user_id", "")
             uname = u.get("username", "Unknown")
             prefix = "👑 " if self.session_client and uid == self.session_client._host_id else ""
             suffix = " (you)" if self.session_client and uid == self.session_client.user_id else ""
-            self.users_list.addItem(f"{prefix}{uname}{suffix}")
+            items.append(f"{prefix}{uname}{suffix}")
+        self.users_list.setUpdatesEnabled(False)
+        try:
+            self.users_list.clear()
+            self.users_list.addItems(items)
+        finally:
+            self.users_list.setUpdatesEnabled(True)
 
     def _show_user_context_menu(self, pos):
         """Right-click context menu on users list — host can kick."""
@@ -1605,7 +1833,6 @@ class SessionPanel(QFrame):
         # Can't kick yourself
         if uid == self.session_client.user_id:
             return
-        from PyQt5.QtWidgets import QMenu
         menu = QMenu(self)
         menu.setStyleSheet(f"""
             QMenu {{
@@ -1630,19 +1857,26 @@ class SessionPanel(QFrame):
         # Clear uploading flag on error so user can try again
         if self._player:
             self._player._session_uploading = False
+            self._player._invalidate_session_client()  # May be a dropped connection
 
     def _show_disconnected(self, reason=""):
-        self.connect_section.setVisible(True)
-        self.session_section.setVisible(False)
-        self.connection_status.setText(f"Disconnected: {reason}" if reason else "Disconnected")
-        self.connection_status.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 10px; border: none;")
-        self.session_client = None
-        self.shared_pool_cb.setChecked(False)
+        self.setUpdatesEnabled(False)
+        try:
+            self.connect_section.setVisible(True)
+            self.connection_status.setText(f"Disconnected: {reason}" if reason else "Disconnected")
+            self.connection_status.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 10px; border: none;")
+            self.session_client = None
+            if self._session_ui_built:
+                self.session_section.setVisible(False)
+                self.shared_pool_cb.setChecked(False)
+        finally:
+            self.setUpdatesEnabled(True)
         # Update connection dot and reset shared pool
         if self._player:
             self._player._update_session_dot(False)
             self._player._session_shared_pool = False
             self._player._session_uploading = False
+            self._player._invalidate_session_client()
 
     def _on_upload_progress(self, sent, total):
         if total > 0:
@@ -1658,7 +1892,7 @@ class SessionPanel(QFrame):
 
     def _on_video_uploaded(self, video_id, filename, size, uploader):
         self.progress_label.setText(f"📤 {uploader} shared: {filename}")
-        QTimer.singleShot(5000, lambda: self.progress_label.setText(""))
+        self._defer(5.0, self._clear_progress)
 
     def _on_video_ready(self, video_id, local_path):
         self.progress_label.setText("✅ Video ready")
@@ -1690,7 +1924,7 @@ class SessionPanel(QFrame):
                 QTimer.singleShot(500, _apply_sync)
             self._pending_sync_video_id = None
             self._pending_sync_state = {}
-            QTimer.singleShot(3000, lambda: self.progress_label.setText(""))
+            self._defer(3.0, self._clear_progress)
             return
 
         # Ready-sync (non-host): load video, pause, report ready, wait for all_ready
@@ -1700,7 +1934,7 @@ class SessionPanel(QFrame):
                 self._player._load_session_video(local_path)
                 QTimer.singleShot(200, lambda: self._pause_and_report_ready(video_id))
             self._pending_prepare_video_id = None
-            QTimer.singleShot(3000, lambda: self.progress_label.setText(""))
+            self._defer(3.0, self._clear_progress)
             return
 
         # Host uploaded this clip — load, pause, wait for all_ready
@@ -1708,13 +1942,13 @@ class SessionPanel(QFrame):
             if self._player:
                 self._player._load_session_video(local_path)
                 QTimer.singleShot(200, lambda: self._host_wait_for_ready(video_id))
-            QTimer.singleShot(3000, lambda: self.progress_label.setText(""))
+            self._defer(3.0, self._clear_progress)
             return
 
         # Fallback: not in a session, just play
         if self._player:
             self._player._play_session_video(video_id, local_path)
-        QTimer.singleShot(3000, lambda: self.progress_label.setText(""))
+        self._defer(3.0, self._clear_progress)
 
     def _host_wait_for_ready(self, video_id):
         """Host uploaded a clip — pause and wait for all users to be ready."""
@@ -1739,7 +1973,7 @@ class SessionPanel(QFrame):
     def _on_prepare_video(self, video_id, filename, username):
         """Server says a new video is coming — download it and wait."""
         self._pending_prepare_video_id = video_id
-        self.add_activity(f"🎬 {username} shared {filename}")
+        self.add_activity(_FMT_SHARED.format(username, filename))
         self.now_playing_label.setText(f"▶ {filename}")
         self.progress_label.setText(f"⬇ Downloading from {username}...")
 
@@ -1747,7 +1981,7 @@ class SessionPanel(QFrame):
         """Everyone is ready — start playback from the beginning."""
         self.add_activity("✅ All synced — playing!")
         self.progress_label.setText("▶ Playing!")
-        QTimer.singleShot(2000, lambda: self.progress_label.setText(""))
+        self._defer(2.0, self._clear_progress)
         if self._player:
             self._player._session_uploading = False
             self._player._playing_remote_clip = True  # Don't re-share when this clip ends
@@ -1805,6 +2039,120 @@ class SessionPanel(QFrame):
 
 class VideoPlayer(QMainWindow):
     """Main video player window"""
+
+    # Signal to pass folder scan results from the background thread to the UI
+    _scan_finished_signal = pyqtSignal(str, list)
+    # VLC player events arrive on libvlc's thread; re-emitted into the UI thread
+    # (carries the vlc.EventType value; see _on_vlc_event for the routing)
+    _vlc_event_signal = pyqtSignal(int)
+
+    # Static stylesheets, built once at class creation
+    GLOBAL_STYLE = f"""
+        QMainWindow {{
+            background-color: {COLORS['bg_dark']};
+        }}
+        QWidget {{
+            background-color: transparent;
+            color: {COLORS['text_primary']};
+            font-family: 'Segoe UI', sans-serif;
+        }}
+        QMainWindow > QWidget {{
+            background-color: {COLORS['bg_dark']};
+        }}
+        QToolTip {{
+            background-color: {COLORS['bg_light']};
+            color: {COLORS['text_primary']};
+            border: 1px solid {COLORS['border']};
+            border-radius: 6px;
+            padding: 8px 12px;
+            font-size: 12px;
+        }}
+        QSlider::groove:horizontal {{
+            height: 6px;
+            background: {COLORS['bg_light']};
+            border-radius: 3px;
+        }}
+        QSlider::handle:horizontal {{
+            background: {COLORS['text_primary']};
+            border: none;
+            width: 14px;
+            height: 14px;
+            margin: -4px 0;
+            border-radius: 7px;
+        }}
+        QSlider::handle:horizontal:hover {{
+            background: {COLORS['accent_green']};
+        }}
+        QSlider::sub-page:horizontal {{
+            background: {COLORS['accent_green']};
+            border-radius: 3px;
+        }}
+    """
+
+    MENU_BAR_STYLE = f"""
+        QMenuBar {{
+            background-color: {COLORS['bg_medium']};
+            color: {COLORS['text_primary']};
+            border-bottom: 1px solid {COLORS['border']};
+        }}
+        QMenuBar::item {{
+            padding: 8px 12px;
+            background-color: transparent;
+        }}
+        QMenuBar::item:selected {{
+            background-color: {COLORS['accent_blue']};
+        }}
+        QMenu {{
+            background-color: {COLORS['bg_medium']};
+            color: {COLORS['text_primary']};
+            border: 1px solid {COLORS['border']};
+        }}
+        QMenu::item {{
+            padding: 6px 24px;
+        }}
+        QMenu::item:selected {{
+            background-color: {COLORS['accent_blue']};
+        }}
+    """
+
+    # Seconds an os.path.exists result is reused (see _cached_exists)
+    EXISTS_CACHE_TTL = 2.0
+
+    # (exclusive upper bound, icon) pairs for the volume level
+    _VOL_ICONS = ((1, "🔇"), (33, "🔈"), (66, "🔉"), (101, "🔊"))
+
+    # video_label looks; shared string objects let _set_styled_text skip re-polish
+    VIDEO_LABEL_STYLES = {
+        "primary": f"color: {COLORS['text_primary']}; font-size: 13px; padding: 6px 4px;",
+        "secondary": f"color: {COLORS['text_secondary']}; font-size: 13px; padding: 6px 4px;",
+        "warning": f"color: {COLORS['accent_orange']}; font-size: 13px; padding: 6px 4px;",
+        "error": f"color: {COLORS['accent_red']}; font-size: 13px; padding: 6px 4px;",
+    }
+
+    # Set once; the liked look is switched with the "liked" dynamic property
+    LIKE_BTN_STYLE = f"""
+        QPushButton {{
+            background-color: {COLORS['bg_light']};
+            color: {COLORS['text_muted']};
+            font-size: 14px;
+            border: 1px solid {COLORS['border']};
+            border-radius: 4px;
+        }}
+        QPushButton:hover {{
+            background-color: {COLORS['bg_medium']};
+            border-color: {COLORS['accent_green']};
+            color: {COLORS['accent_green']};
+        }}
+        QPushButton:disabled {{
+            background-color: {COLORS['bg_medium']};
+            color: {COLORS['text_muted']};
+        }}
+        QPushButton[liked="true"] {{
+            background-color: {COLORS['accent_green']};
+            color: {COLORS['text_primary']};
+            border: none;
+        }}
+    """
     
     def __init__(self):
         super().__init__()
@@ -1822,10 +2170,14 @@ class VideoPlayer(QMainWindow):
         
         # Folder path from config
         self.clips_folder = self.config_manager.get("clips_folder")
-        self.blocked_clips = set(self.config_manager.get("blocked_clips") or [])
-        self.liked_clips = set(self.config_manager.get("liked_clips") or [])
+        # Shared with the config (no copies); sorted into lists only when saved
+        self.blocked_clips = self.config_manager.get_set("blocked_clips")
+        self.liked_clips = self.config_manager.get_set("liked_clips")
         self.video_files = []
+        self._video_file_set = set()  # Mirror of video_files for set ops
         self.current_video = ""
+        self._scan_in_progress = False
+        self._scan_finished_signal.connect(self._on_scan_complete)
         
         # History tracking
         self.autoplay_enabled = self.config_manager.get("autoplay")
@@ -1833,11 +2185,26 @@ class VideoPlayer(QMainWindow):
         self.auto_hide_controls = self.config_manager.get("auto_hide_controls") or False
         self.play_queue = []  # Shuffled list of clips
         self.queue_index = -1  # Current position in shuffled list
+        self._shuffled_upto = 0  # Slots below this are already shuffled
         
         # UI state
         self.is_slider_pressed = False
+        self._last_slider_pos = 0       # Last values written by _update_playback_ui
+        self._last_time_text = "0:00"
+        self._last_duration_text = "0:00"
+        self._cached_length = 0  # Clip length in ms; 0 until VLC reports it
+        self._like_btn_liked = None  # "liked" property currently set on like_btn
+        self._last_nav_signature = None  # See _update_navigation_state
+        self._queue_state_checked = False  # Saved queue is only considered on the first scan
+        self._clip_name_cache = {}  # path -> (file name, display name), see _clip_names
+        self._exists_cache = {}  # path -> (exists, monotonic time checked), see _cached_exists
+        self._status_bar_sig = None  # (queue len, index, autoplay) behind _status_bar_text
+        self._status_bar_text = ""
         self._last_volume = self.config_manager.get("volume")
         self._cached_fps = 0  # Cache FPS to avoid repeated VLC calls
+        self._cached_frame_ms = 33  # One frame at _cached_fps (~30fps until known)
+        self._fps_retry_pending = False  # Re-read FPS on the first TimeChanged if still 0
+        self._media_events = None  # Current media's EventManager, kept alive while it plays
         
         # Session (Watch Together) state
         self._session_active = False
@@ -1846,31 +2213,69 @@ class VideoPlayer(QMainWindow):
         self._session_shared_pool = False  # Shared random pool mode
         self._playing_remote_clip = False  # True when current clip came from another user
         self._session_uploading = False    # True while uploading a clip to session
+        # Seek/speed changes are sent at most once per 50ms window (latest value wins)
+        self._pending_seek = None
+        self._pending_speed = None
+        self._session_send_timer = QTimer(self)
+        self._session_send_timer.setSingleShot(True)
+        self._session_send_timer.setInterval(50)
+        self._session_send_timer.timeout.connect(self._flush_session_sends)
+        self._cached_session_client = None  # See _get_session_client
+        self._session_client_dirty = True
         
         # Setup UI
         self._setup_ui()
         self._create_menu_bar()
         self._apply_global_styles()
+        self._action_map = self._build_action_map()
         self._setup_keyboard_shortcuts()
         
         # Initial folder check
-        if not self.clips_folder or not os.path.exists(self.clips_folder):
+        if not self.clips_folder or not self._cached_exists(self.clips_folder):
             self.video_label.setText("⚠  Please select a clips folder to begin")
             QTimer.singleShot(500, self.select_folder) # Delay slightly to let UI render
         else:
             self.scan_folder()
-            self._update_status_bar()
         
-        # Timer for updating slider and time (smoother at 20fps)
+        # Slider/time follow libVLC's TimeChanged events; this slow timer is
+        # only a fallback for when events stall (e.g. paused on a seek)
         self.timer = QTimer(self)
-        self.timer.setInterval(50)
+        self.timer.setInterval(500)
         self.timer.timeout.connect(self._update_playback_ui)
+
+        # VLC events: one libVLC-thread callback per type, one queued signal,
+        # and a dispatch table on the UI side
+        self._vlc_handlers = {
+            vlc.EventType.MediaPlayerTimeChanged.value: self._on_vlc_time,
+            vlc.EventType.MediaPlayerPlaying.value: self._on_vlc_playing,
+            vlc.EventType.MediaPlayerPaused.value: self._on_vlc_paused,
+            vlc.EventType.MediaPlayerStopped.value: self._on_vlc_paused,
+            vlc.EventType.MediaPlayerEndReached.value: self._on_vlc_ended,
+        }
+        self._vlc_time_changed = vlc.EventType.MediaPlayerTimeChanged.value
+        self._time_event_pending = False  # Coalesces TimeChanged bursts
+        self._vlc_event_signal.connect(self._on_vlc_event)
+        # Held on self: python-vlc keeps the ctypes callbacks on the manager,
+        # and libVLC would call freed memory if it were garbage collected
+        self._vlc_events = self.player.event_manager()
+        for event_type in self._vlc_handlers:
+            self._vlc_events.event_attach(vlc.EventType(event_type),
+                                lambda _e, t=event_type: self._on_vlc_callback(t))
+        # Per-media event, attached in _play_video
+        self._vlc_media_parsed = vlc.EventType.MediaParsedChanged.value
+        self._vlc_handlers[self._vlc_media_parsed] = self._on_vlc_media_parsed
         
         # Auto-hide timer for controls
         self.hide_controls_timer = QTimer(self)
         self.hide_controls_timer.setInterval(2000)  # 2 seconds
         self.hide_controls_timer.setSingleShot(True)
         self.hide_controls_timer.timeout.connect(self._hide_controls)
+
+        # Transient status messages revert via one restartable timer, so rapid
+        # key presses leave a single pending _update_status_bar, not a stack
+        self._status_reset_timer = QTimer(self)
+        self._status_reset_timer.setSingleShot(True)
+        self._status_reset_timer.timeout.connect(self._update_status_bar)
         
         # Enable mouse tracking for auto-hide
         self.setMouseTracking(True)
@@ -1882,31 +2287,7 @@ class VideoPlayer(QMainWindow):
         """Create the application menu bar"""
         navbar = self.menuBar()
         assert navbar is not None
-        navbar.setStyleSheet(f"""
-            QMenuBar {{
-                background-color: {COLORS['bg_medium']};
-                color: {COLORS['text_primary']};
-                border-bottom: 1px solid {COLORS['border']};
-            }}
-            QMenuBar::item {{
-                padding: 8px 12px;
-                background-color: transparent;
-            }}
-            QMenuBar::item:selected {{
-                background-color: {COLORS['accent_blue']};
-            }}
-            QMenu {{
-                background-color: {COLORS['bg_medium']};
-                color: {COLORS['text_primary']};
-                border: 1px solid {COLORS['border']};
-            }}
-            QMenu::item {{
-                padding: 6px 24px;
-            }}
-            QMenu::item:selected {{
-                background-color: {COLORS['accent_blue']};
-            }}
-        """)
+        navbar.setStyleSheet(self.MENU_BAR_STYLE)
         
         # File Menu
         file_menu = navbar.addMenu("File")
@@ -1940,7 +2321,7 @@ class VideoPlayer(QMainWindow):
         
         exit_action = QAction("Exit", self)
         exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(lambda: (self.close(), None)[-1])
+        exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
         
         # Settings Menu
@@ -1983,7 +2364,7 @@ class VideoPlayer(QMainWindow):
                 self._show_controls()
                 if old_auto_hide:
                     self.status_label.setText("Auto-hide disabled")
-            QTimer.singleShot(1500, self._update_status_bar)
+            self._status_reset_timer.start(1500)
 
     def select_folder(self):
         """Open dialog to select clips folder"""
@@ -1992,7 +2373,6 @@ class VideoPlayer(QMainWindow):
             self.clips_folder = folder
             self.config_manager.set("clips_folder", folder)
             self.scan_folder()
-            self._update_status_bar()
 
     def show_blocked_dialog(self):
         """Show dialog to manage blocked clips"""
@@ -2000,10 +2380,10 @@ class VideoPlayer(QMainWindow):
         if dialog.exec_():
             removed = dialog.get_removed_clips()
             if removed:
-                self.blocked_clips -= removed
-                self.config_manager.set("blocked_clips", list(self.blocked_clips))
+                for path in removed:
+                    self.config_manager.remove_from_set("blocked_clips", path)
                 self.video_label.setText(f"✅ Unblocked {len(removed)} clips")
-                QTimer.singleShot(2000, lambda: self._update_status_bar() if not self.current_video else None)
+                self._status_reset_timer.start(2000)
 
     def _setup_ui(self):
         """Initialize all UI components"""
@@ -2037,6 +2417,10 @@ class VideoPlayer(QMainWindow):
         self.video_frame.setStyleSheet("background-color: #000000; border-radius: 4px;")
         self.video_frame.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         video_layout.addWidget(self.video_frame)
+        # Resize/move of the frame or its container invalidates the cached hit rect
+        self._cached_video_rect = None
+        self.video_frame.installEventFilter(self)
+        video_container.installEventFilter(self)
         
         main_layout.addWidget(video_container, stretch=1)
         
@@ -2103,7 +2487,7 @@ class VideoPlayer(QMainWindow):
         # Skip back
         self.skip_back_btn = StyledButton("−10s")
         self.skip_back_btn.setMinimumSize(50, 36)
-        self.skip_back_btn.clicked.connect(lambda: self._skip(-10000))
+        self.skip_back_btn.clicked.connect(self._skip_back_10s)
         self.skip_back_btn.setToolTip("Skip back (←)")
         self.button_bar.add_widget(self.skip_back_btn, "skip_back", stretch=1)
         
@@ -2117,7 +2501,7 @@ class VideoPlayer(QMainWindow):
         # Skip forward
         self.skip_fwd_btn = StyledButton("+10s")
         self.skip_fwd_btn.setMinimumSize(50, 36)
-        self.skip_fwd_btn.clicked.connect(lambda: self._skip(10000))
+        self.skip_fwd_btn.clicked.connect(self._skip_fwd_10s)
         self.skip_fwd_btn.setToolTip("Skip forward (→)")
         self.button_bar.add_widget(self.skip_fwd_btn, "skip_fwd", stretch=1)
         
@@ -2135,6 +2519,7 @@ class VideoPlayer(QMainWindow):
         # Like/Dislike
         self.like_btn = StyledButton("👍")
         self.like_btn.setMinimumSize(40, 36)
+        self.like_btn.setStyleSheet(self.LIKE_BTN_STYLE)
         self.like_btn.clicked.connect(self.toggle_like)
         self.like_btn.setToolTip("Like (L)")
         self.like_btn.setEnabled(False)
@@ -2182,6 +2567,7 @@ class VideoPlayer(QMainWindow):
         volume_layout.setSpacing(4)
         
         self.volume_icon = QLabel("🔊")
+        self._last_vol_icon = "🔊"
         self.volume_icon.setFixedWidth(16)
         volume_layout.addWidget(self.volume_icon)
         
@@ -2191,6 +2577,7 @@ class VideoPlayer(QMainWindow):
         self.volume_slider.setMinimumWidth(50)
         self.volume_slider.setMaximumWidth(80)
         self.volume_slider.valueChanged.connect(self._set_volume)
+        self.volume_slider.sliderReleased.connect(self._save_volume)
         self.volume_slider.setToolTip("Volume (↑/↓)")
         volume_layout.addWidget(self.volume_slider)
         
@@ -2212,7 +2599,8 @@ class VideoPlayer(QMainWindow):
         main_layout.addWidget(self.controls_container)
         
         # Set initial volume
-        self.player.audio_set_volume(int(self._last_volume or 80))
+        self._last_applied_volume = int(self._last_volume or 80)
+        self.player.audio_set_volume(self._last_applied_volume)
         
         # Add main content to top layout
         top_layout.addWidget(main_container, stretch=1)
@@ -2223,49 +2611,19 @@ class VideoPlayer(QMainWindow):
             self._session_panel.setVisible(False)
             top_layout.addWidget(self._session_panel)
 
+    @staticmethod
+    def _set_styled_text(widget, text, style):
+        """Set a label's text and stylesheet, skipping calls that change nothing
+        (setStyleSheet re-polishes even when the string is identical)"""
+        if widget.text() != text:
+            widget.setText(text)
+        if getattr(widget, "_rdm_style", None) is not style:
+            widget._rdm_style = style
+            widget.setStyleSheet(style)
+
     def _apply_global_styles(self):
         """Apply global application styles"""
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {COLORS['bg_dark']};
-            }}
-            QWidget {{
-                background-color: transparent;
-                color: {COLORS['text_primary']};
-                font-family: 'Segoe UI', sans-serif;
-            }}
-            QMainWindow > QWidget {{
-                background-color: {COLORS['bg_dark']};
-            }}
-            QToolTip {{
-                background-color: {COLORS['bg_light']};
-                color: {COLORS['text_primary']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 6px;
-                padding: 8px 12px;
-                font-size: 12px;
-            }}
-            QSlider::groove:horizontal {{
-                height: 6px;
-                background: {COLORS['bg_light']};
-                border-radius: 3px;
-            }}
-            QSlider::handle:horizontal {{
-                background: {COLORS['text_primary']};
-                border: none;
-                width: 14px;
-                height: 14px;
-                margin: -4px 0;
-                border-radius: 7px;
-            }}
-            QSlider::handle:horizontal:hover {{
-                background: {COLORS['accent_green']};
-            }}
-            QSlider::sub-page:horizontal {{
-                background: {COLORS['accent_green']};
-                border-radius: 3px;
-            }}
-        """)
+        self.setStyleSheet(self.GLOBAL_STYLE)
 
     def _setup_keyboard_shortcuts(self):
         """Configure keyboard shortcuts from config"""
@@ -2276,34 +2634,27 @@ class VideoPlayer(QMainWindow):
                 shortcut.deleteLater()
         self._shortcuts = []
         
-        # Key name to Qt key mapping
-        key_map = {
-            "Space": Qt.Key_Space, "Return": Qt.Key_Return, "Escape": Qt.Key_Escape,
-            "Backspace": Qt.Key_Backspace, "Delete": Qt.Key_Delete, "Tab": Qt.Key_Tab,
-            "Left": Qt.Key_Left, "Right": Qt.Key_Right, "Up": Qt.Key_Up, "Down": Qt.Key_Down,
-            "Period": Qt.Key_Period, "Comma": Qt.Key_Comma,
-            "Home": Qt.Key_Home, "End": Qt.Key_End, "PageUp": Qt.Key_PageUp, "PageDown": Qt.Key_PageDown,
-        }
-        # Add letter keys A-Z
-        for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
-            key_map[c] = getattr(Qt, f"Key_{c}")
-        # Add number keys 0-9
-        for n in "0123456789":
-            key_map[n] = getattr(Qt, f"Key_{n}")
-        # Add function keys F1-F12
-        for i in range(1, 13):
-            key_map[f"F{i}"] = getattr(Qt, f"Key_F{i}")
-        
-        # Action name to callback mapping
-        action_map = {
+        # Get keybinds from config
+        keybinds = self.config_manager.get("keybinds") or {}
+        
+        for action_name, callback in self._action_map.items():
+            key_name = keybinds.get(action_name, "")
+            if key_name and key_name in _KEY_MAP:
+                shortcut = QShortcut(QKeySequence(_KEY_MAP[key_name]), self)
+                shortcut.activated.connect(callback)
+                self._shortcuts.append(shortcut)
+
+    def _build_action_map(self):
+        """Action name to callback mapping (built once; shortcuts reload from it)"""
+        return {
             "play_random": self.play_random_clip,
             "play_pause": self._toggle_play_pause,
             "toggle_speed": self._toggle_slow_motion_keyboard,
-            "skip_back": lambda: self._skip(-10000),
-            "skip_forward": lambda: self._skip(10000),
+            "skip_back": self._skip_back_10s,
+            "skip_forward": self._skip_fwd_10s,
             "previous_clip": self.play_previous_clip,
-            "volume_up": lambda: self.volume_slider.setValue(min(100, self.volume_slider.value() + 5)),
-            "volume_down": lambda: self.volume_slider.setValue(max(0, self.volume_slider.value() - 5)),
+            "volume_up": self._volume_up,
+            "volume_down": self._volume_down,
             "mute": self._toggle_mute,
             "stop": self._stop,
             "reshuffle": self._reset_cycle,
@@ -2314,103 +2665,225 @@ class VideoPlayer(QMainWindow):
             "frame_forward": self._frame_step_forward,
             "frame_backward": self._frame_step_backward,
         }
-        
-        # Get keybinds from config
-        keybinds = self.config_manager.get("keybinds") or {}
-        
-        for action_name, callback in action_map.items():
-            key_name = keybinds.get(action_name, "")
-            if key_name and key_name in key_map:
-                shortcut = QShortcut(QKeySequence(key_map[key_name]), self)
-                shortcut.activated.connect(callback)
-                self._shortcuts.append(shortcut)
 
     # ========================================================================
     # Folder and Clip Management
     # ========================================================================
 
     def scan_folder(self):
-        """Scan the clips folder for video files"""
-        self.video_files = []
-        
-        if not self.clips_folder or not os.path.exists(self.clips_folder):
-            self.video_label.setText(f"⚠  Folder not found: {self.clips_folder}")
-            self.video_label.setStyleSheet(f"color: {COLORS['accent_red']}; font-size: 13px; padding: 6px 4px;")
+        """Scan the clips folder for video files in a background thread"""
+        if not self.clips_folder or not self._cached_exists(self.clips_folder):
+            self.video_files = []
+            self._video_file_set = set()
+            self._set_styled_text(self.video_label, f"⚠  Folder not found: {self.clips_folder}", self.VIDEO_LABEL_STYLES["error"])
             return
-            
-        for file in Path(self.clips_folder).rglob("*"):
-            if file.suffix.lower() in VIDEO_EXTENSIONS:
-                self.video_files.append(str(file))
+
+        # A scan already running re-checks the folder when it finishes
+        if self._scan_in_progress:
+            return
+        self._scan_in_progress = True
+
+        self._set_styled_text(self.video_label, "🔍  Scanning clips folder...", self.VIDEO_LABEL_STYLES["secondary"])
+
+        folder = self.clips_folder
+        import threading
+        def scan():
+            # Always emit, or _scan_in_progress would block every later scan
+            files = []
+            try:
+                cache = load_scan_cache()
+                files, new_cache = scan_video_files(folder, cache)
+                if new_cache != cache:
+                    save_scan_cache(new_cache)
+            except Exception as e:
+                log.error("Scan of %s failed: %s", folder, e)
+                files = []
+            finally:
+                self._scan_finished_signal.emit(folder, files)
+        threading.Thread(target=scan, daemon=True).start()
+
+    def _on_scan_complete(self, folder, files):
+        """Apply background scan results on the UI thread"""
+        self._scan_in_progress = False
+        if folder != self.clips_folder:
+            # Folder changed while scanning — start over with the new one
+            self.scan_folder()
+            return
+
+        self.video_files = files
+        self._video_file_set = set(files)
         
-        # Prepare shuffled queue
-        self._refresh_queue()
+        # Resume the last session's queue if the library is unchanged (first scan only)
+        if self._queue_state_checked or not self._restore_queue_state():
+            self._refresh_queue()
+        self._queue_state_checked = True
         
         count = len(self.video_files)
-        self.video_label.setText(f"📁  Found {count:,} clips — Ready to play")
-        self.video_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 13px; padding: 6px 4px;")
+        self._set_styled_text(self.video_label, f"📁  Found {count:,} clips — Ready to play", self.VIDEO_LABEL_STYLES["secondary"])
         self._update_clip_counter()
+        self._update_status_bar()
 
     def _refresh_queue(self):
-        """Create a new shuffled queue of available clips"""
-        available_clips = [
-            f for f in self.video_files 
-            if f not in self.blocked_clips
-        ]
-        
-        # Filter by favorites if enabled
+        """Create a new queue of available clips (shuffled lazily by _advance_queue)"""
         if self.favorites_only:
-            available_clips = [f for f in available_clips if f in self.liked_clips]
+            # Set ops iterate the smaller operand, so favorites mode scales
+            # with the number of likes rather than the library size
+            available_clips = list((self.liked_clips & self._video_file_set) - self.blocked_clips)
+        elif self.blocked_clips:
+            blocked = self.blocked_clips
+            available_clips = [f for f in self.video_files if f not in blocked]
+        else:
+            # One pointer copy; _advance_queue swaps in place, so no shuffle
+            # pass (and no separate index array) is needed here
+            available_clips = list(self.video_files)
         
         if not available_clips:
             self.play_queue = []
             self.queue_index = -1
+            self._shuffled_upto = 0
             return
 
-        random.shuffle(available_clips)
         self.play_queue = available_clips
         self.queue_index = -1
+        self._shuffled_upto = 0
+
+    def _queue_signature(self):
+        """Stable hash of everything _refresh_queue builds the queue from"""
+        h = hashlib.sha1()
+        h.update(b"fav" if self.favorites_only else b"all")
+        groups = [self.video_files, self.blocked_clips]
+        if self.favorites_only:
+            groups.append(self.liked_clips)
+        for group in groups:
+            for path in sorted(group):
+                h.update(path.encode("utf-8", "surrogatepass"))
+                h.update(b"\0")
+            h.update(b"\1")
+        return h.hexdigest()
+
+    def _save_queue_state(self):
+        """Persist the play queue and position for the next launch"""
+        if not self.play_queue:
+            return
+        state = {
+            "queue_hash": self._queue_signature(),
+            "queue": self.play_queue,
+            "index": self.queue_index,
+            "shuffled_upto": self._shuffled_upto,
+        }
+        try:
+            with open(QUEUE_STATE_FILE, 'w') as f:
+                json.dump(state, f)
+        except Exception as e:
+            log.warning("Failed to save queue state: %s", e)
+
+    def _restore_queue_state(self):
+        """Restore the saved queue if it was built from the same library/filters.
+        Returns True if the queue was restored."""
+        if not QUEUE_STATE_FILE.exists():
+            return False
+        try:
+            with open(QUEUE_STATE_FILE, 'r') as f:
+                state = json.load(f)
+            queue = state["queue"]
+            index = int(state["index"])
+            # Files saved before the mark existed: everything up to index was played
+            shuffled_upto = int(state.get("shuffled_upto", index + 1))
+            if state["queue_hash"] != self._queue_signature() or not isinstance(queue, list):
+                return False
+        except Exception:
+            return False
+
+        # Clips blocked during the last session were left in its queue
+        if self.blocked_clips:
+            blocked = self.blocked_clips
+            kept = []
+            for i, path in enumerate(queue):
+                if path in blocked:
+                    if i <= index:
+                        index -= 1
+                    if i < shuffled_upto:
+                        shuffled_upto -= 1
+                else:
+                    kept.append(path)
+            queue = kept
+        if not queue:
+            return False
+
+        self.play_queue = queue
+        self.queue_index = max(-1, min(index, len(queue) - 1))
+        self._shuffled_upto = max(self.queue_index + 1, min(shuffled_upto, len(queue)))
+        return True
+
+    def _cached_exists(self, path):
+        """os.path.exists, reusing a result younger than EXISTS_CACHE_TTL seconds"""
+        now = time.monotonic()
+        hit = self._exists_cache.get(path)
+        if hit is not None and now - hit[1] < self.EXISTS_CACHE_TTL:
+            return hit[0]
+        if len(self._exists_cache) > 256:
+            self._exists_cache.clear()
+        exists = os.path.exists(path)
+        self._exists_cache[path] = (exists, now)
+        return exists
+
+    def _clip_names(self, path):
+        """(file name, label-truncated name) for a clip path, memoized per path"""
+        names = self._clip_name_cache.get(path)
+        if names is None:
+            filename = os.path.basename(path)
+            display_name = filename if len(filename) <= 65 else filename[:62] + "..."
+            names = self._clip_name_cache[path] = (filename, display_name)
+        return names
+
+    def _advance_queue(self):
+        """Step to the next queue slot, shuffling lazily.
+
+        Each new slot gets one Fisher-Yates swap, so only the clips actually
+        played get shuffled. Slots below _shuffled_upto are fixed: after
+        Previous, Next replays them in order instead of swapping an already
+        played clip back into the unplayed part of the cycle. Returns True if
+        the queue wrapped around (a new cycle).
+        """
+        queue = self.play_queue
+        self.queue_index += 1
+        wrapped = self.queue_index >= len(queue)
+        if wrapped:
+            self.queue_index = 0
+            self._shuffled_upto = 0
+        i = self.queue_index
+        if i >= self._shuffled_upto:
+            j = random.randrange(i, len(queue))
+            queue[i], queue[j] = queue[j], queue[i]
+            self._shuffled_upto = i + 1
+        return wrapped
 
     def _update_navigation_state(self):
         """Update state of navigation and rating buttons"""
-        self.prev_clip_btn.setEnabled(self.queue_index > 0)
-        
         has_video = bool(self.current_video)
         in_session = self._get_session_client() is not None
+        is_liked = has_video and self.current_video in self.liked_clips
+
+        # Nothing the buttons/labels show has changed since the last call
+        signature = (self.queue_index, len(self.play_queue), self.current_video,
+                     is_liked, in_session, self.autoplay_enabled)
+        if signature == self._last_nav_signature:
+            return
+        self._last_nav_signature = signature
+
+        self.prev_clip_btn.setEnabled(self.queue_index > 0)
 
         # Disable like/dislike in session mode (remote clips can't be favorited)
         self.block_btn.setEnabled(has_video and not in_session)
         self.like_btn.setEnabled(has_video and not in_session)
         
-        # Update Like button visual state (green when liked)
-        if has_video and self.current_video in self.liked_clips:
-            self.like_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {COLORS['accent_green']};
-                    color: {COLORS['text_primary']};
-                    font-size: 14px;
-                    border: none;
-                    border-radius: 4px;
-                }}
-            """)
-        else:
-            self.like_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {COLORS['bg_light']};
-                    color: {COLORS['text_muted']};
-                    font-size: 14px;
-                    border: 1px solid {COLORS['border']};
-                    border-radius: 4px;
-                }}
-                QPushButton:hover {{
-                    background-color: {COLORS['bg_medium']};
-                    border-color: {COLORS['accent_green']};
-                    color: {COLORS['accent_green']};
-                }}
-                QPushButton:disabled {{
-                    background-color: {COLORS['bg_medium']};
-                    color: {COLORS['text_muted']};
-                }}
-            """)
+        # Update Like button visual state (green when liked); only re-polish on change
+        if is_liked != self._like_btn_liked:
+            self._like_btn_liked = is_liked
+            self.like_btn.setProperty("liked", is_liked)
+            style = self.like_btn.style()
+            style.unpolish(self.like_btn)
+            style.polish(self.like_btn)
         
         self._update_clip_counter()
         self._update_status_bar()
@@ -2426,7 +2899,8 @@ class VideoPlayer(QMainWindow):
 
         client = self._get_session_client()
         if DEBUG_MODE:
-            logging.getLogger("rdm").debug(f"play_random_clip: queue_len={len(self.play_queue)}, idx={self.queue_index}, shared_pool={self._session_shared_pool}, in_session={client is not None}")
+            log.debug("play_random_clip: queue_len=%d, idx=%d, shared_pool=%s, in_session=%s",
+                      len(self.play_queue), self.queue_index, self._session_shared_pool, client is not None)
 
         # In session with shared pool: ask server to pick a random user
         if client and self._session_shared_pool:
@@ -2437,25 +2911,20 @@ class VideoPlayer(QMainWindow):
         if not self.play_queue:
             self._refresh_queue()
             if not self.play_queue:
-                self.video_label.setText("⚠  No playable clips found (check blocked list)")
-                self.video_label.setStyleSheet(f"color: {COLORS['accent_orange']}; font-size: 13px; padding: 6px 4px;")
+                self._set_styled_text(self.video_label, "⚠  No playable clips found (check blocked list)", self.VIDEO_LABEL_STYLES["warning"])
                 return
 
         # Advance index
-        self.queue_index += 1
-        if self.queue_index >= len(self.play_queue):
+        if self._advance_queue():
             self.video_label.setText("🔄  All clips played! Reshuffling...")
-            random.shuffle(self.play_queue)
-            self.queue_index = 0
 
         self.current_video = self.play_queue[self.queue_index]
         self._update_navigation_state()
 
         # In session mode: DON'T play locally — upload first, wait for all_ready
         if client:
-            filename = os.path.basename(self.current_video)
-            self.video_label.setText(f"⏳ Uploading: {filename}")
-            self.video_label.setStyleSheet(f"color: {COLORS['accent_orange']}; font-size: 13px; padding: 6px 4px;")
+            filename, _ = self._clip_names(self.current_video)
+            self._set_styled_text(self.video_label, f"⏳ Uploading: {filename}", self.VIDEO_LABEL_STYLES["warning"])
             self.status_label.setText("⏳ Syncing with session...")
             self._session_auto_share()
             return
@@ -2477,7 +2946,7 @@ class VideoPlayer(QMainWindow):
             # In session mode: upload first, don't play locally
             client = self._get_session_client()
             if client:
-                filename = os.path.basename(self.current_video)
+                filename, _ = self._clip_names(self.current_video)
                 self.video_label.setText(f"⏳ Uploading: {filename}")
                 self.status_label.setText("⏳ Syncing with session...")
                 self._session_auto_share()
@@ -2491,7 +2960,7 @@ class VideoPlayer(QMainWindow):
         self.config_manager.set("autoplay", self.autoplay_enabled)
         state = "enabled" if self.autoplay_enabled else "disabled"
         self.status_label.setText(f"Autoplay {state}")
-        QTimer.singleShot(1500, self._update_status_bar)
+        self._status_reset_timer.start(1500)
 
     def toggle_favorites_only(self):
         """Toggle favorites-only mode"""
@@ -2502,8 +2971,7 @@ class VideoPlayer(QMainWindow):
         
         if self.favorites_only:
             if not self.play_queue:
-                self.video_label.setText("⭐ No favorites yet! Like some clips first (L)")
-                self.video_label.setStyleSheet(f"color: {COLORS['accent_orange']}; font-size: 13px;")
+                self._set_styled_text(self.video_label, "⭐ No favorites yet! Like some clips first (L)", self.VIDEO_LABEL_STYLES["warning"])
             else:
                 self.video_label.setText(f"⭐ Favorites mode: {len(self.play_queue)} clips")
             self.status_label.setText("Favorites ON")
@@ -2511,21 +2979,32 @@ class VideoPlayer(QMainWindow):
             self.video_label.setText(f"📁  {len(self.play_queue)} clips ready")
             self.status_label.setText("Showing all clips")
         
-        QTimer.singleShot(2000, self._update_status_bar)
+        self._status_reset_timer.start(2000)
 
     def open_current_in_explorer(self):
         """Open the folder containing the current clip"""
-        if self.current_video and os.path.exists(self.current_video):
+        if self.current_video and self._cached_exists(self.current_video):
+            if not hasattr(ctypes, "windll"):
+                # Non-Windows: let the desktop open the folder (non-blocking)
+                folder = os.path.dirname(self.current_video)
+                if not QDesktopServices.openUrl(QUrl.fromLocalFile(folder)):
+                    self.status_label.setText("⚠ Failed to open explorer")
+                return
+
             # Select the file in explorer
             subprocess_args = f'/select,"{self.current_video}"'
-            try:
-                # Use standard Windows command
-                ctypes.windll.shell32.ShellExecuteW(
-                    None, "open", "explorer.exe", subprocess_args, None, 1
-                )
-            except Exception as e:
-                self.status_label.setText("⚠ Failed to open explorer")
-                logging.getLogger("rdm").warning(f"Explorer error: {e}")
+
+            def launch():
+                # ShellExecuteW can stall on shell start-up; keep it off the GUI thread
+                try:
+                    ctypes.windll.shell32.ShellExecuteW(
+                        None, "open", "explorer.exe", subprocess_args, None, 1
+                    )
+                except Exception as e:
+                    log.warning("Explorer error: %s", e)
+
+            import threading
+            threading.Thread(target=launch, daemon=True).start()
 
     def toggle_like(self):
         """Toggle like status for current clip"""
@@ -2533,15 +3012,14 @@ class VideoPlayer(QMainWindow):
             return
             
         if self.current_video in self.liked_clips:
-            self.liked_clips.remove(self.current_video)
+            self.config_manager.remove_from_set("liked_clips", self.current_video)
             self.status_label.setText("💔 Like removed")
         else:
-            self.liked_clips.add(self.current_video)
+            self.config_manager.add_to_set("liked_clips", self.current_video)
             self.status_label.setText("♥ Liked!")
             
-        self.config_manager.set("liked_clips", list(self.liked_clips))
         self._update_navigation_state()
-        QTimer.singleShot(1500, self._update_status_bar)
+        self._status_reset_timer.start(1500)
 
     def block_current_clip(self):
         """Add current clip to blocked list and skip to next"""
@@ -2558,16 +3036,14 @@ class VideoPlayer(QMainWindow):
         )
         
         if reply == QMessageBox.Yes:
-            self.blocked_clips.add(self.current_video)
-            self.config_manager.set("blocked_clips", list(self.blocked_clips))
+            self.config_manager.add_to_set("blocked_clips", self.current_video)
             
             # Remove from likes if present
             if self.current_video in self.liked_clips:
-                self.liked_clips.remove(self.current_video)
-                self.config_manager.set("liked_clips", list(self.liked_clips))
+                self.config_manager.remove_from_set("liked_clips", self.current_video)
             
             self.status_label.setText("👎 Clip disliked")
-            QTimer.singleShot(2000, self._update_status_bar)
+            self._status_reset_timer.start(2000)
             
             # Immediately play next random clip
             self.play_random_clip()
@@ -2586,10 +3062,23 @@ class VideoPlayer(QMainWindow):
     def _play_video(self, filepath):
         """Play a specific video file"""
         if DEBUG_MODE:
-            logging.getLogger("rdm").debug(f"_play_video: {filepath}")
+            log.debug("_play_video: %s", filepath)
         assert self.instance is not None
         media = self.instance.media_new(filepath)
+        # FPS is read as soon as VLC has parsed the file (see _on_vlc_media_parsed).
+        # The manager replaces the previous media's, and is held so its ctypes
+        # callback isn't garbage collected while libVLC can still fire it
+        if self._media_events is not None:
+            self._media_events.event_detach(vlc.EventType.MediaParsedChanged)
+        self._media_events = media.event_manager()
+        self._media_events.event_attach(
+            vlc.EventType.MediaParsedChanged,
+            lambda _e: self._on_vlc_callback(self._vlc_media_parsed))
         self.player.set_media(media)
+        self._cached_length = 0
+        self._cached_fps = 0
+        self._cached_frame_ms = 33
+        self._fps_retry_pending = True
         
         # Set video output based on platform
         if sys.platform.startswith('linux'):
@@ -2599,17 +3088,13 @@ class VideoPlayer(QMainWindow):
         elif sys.platform == "darwin":
             self.player.set_nsobject(int(self.video_frame.winId()))
         
+        media.parse_with_options(vlc.MediaParseFlag.local, 0)
         self.player.play()
         self.timer.start()
         
-        # Cache FPS after a short delay (VLC needs time to read metadata)
-        QTimer.singleShot(200, self._cache_fps)
-        
         # Update UI with truncated filename
-        filename = os.path.basename(filepath)
-        display_name = filename if len(filename) <= 65 else filename[:62] + "..."
-        self.video_label.setText(f"▶  {display_name}")
-        self.video_label.setStyleSheet(f"color: {COLORS['text_primary']}; font-size: 13px; padding: 6px 4px;")
+        _, display_name = self._clip_names(filepath)
+        self._set_styled_text(self.video_label, f"▶  {display_name}", self.VIDEO_LABEL_STYLES["primary"])
         self.play_btn.setText("⏸  Pause")
         
         # Apply current playback rate from speed button
@@ -2656,7 +3141,7 @@ class VideoPlayer(QMainWindow):
         """Set playback speed from scroll wheel"""
         self.player.set_rate(speed)
         self.status_label.setText(f"Speed: {speed}x")
-        QTimer.singleShot(1500, self._update_status_bar)
+        self._status_reset_timer.start(1500)
         self._session_send_speed(speed)
         
     def _apply_current_speed(self):
@@ -2671,54 +3156,63 @@ class VideoPlayer(QMainWindow):
         self.play_btn.setText("▶  Play")
         self.time_slider.setValue(0)
         self.time_label.setText("0:00")
-        self.video_label.setText("⏹  Stopped — Press Space to play next clip")
-        self.video_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 13px; padding: 6px 4px;")
+        self._last_slider_pos = 0
+        self._last_time_text = "0:00"
+        self._set_styled_text(self.video_label, "⏹  Stopped — Press Space to play next clip", self.VIDEO_LABEL_STYLES["secondary"])
 
     def _skip(self, ms):
         """Skip forward or backward by milliseconds"""
         current = self.player.get_time()
-        duration = self.player.get_length()
+        duration = self._cached_length if self._cached_length > 0 else self.player.get_length()
         new_time = max(0, min(duration, current + ms))
         self.player.set_time(int(new_time))
+        self._refresh_playback_ui_soon()
+
+    def _skip_back_10s(self):
+        """Skip back 10 seconds"""
+        self._skip(-10000)
+
+    def _skip_fwd_10s(self):
+        """Skip forward 10 seconds"""
+        self._skip(10000)
 
     def _cache_fps(self):
-        """Cache the FPS of current video"""
+        """Cache the FPS of current video and the matching frame duration"""
         fps = self.player.get_fps()
         self._cached_fps = fps if fps and fps > 0 else 0
-
-    def _get_frame_duration_ms(self):
-        """Get the duration of one frame in milliseconds based on cached fps"""
-        if self._cached_fps > 0:
-            return max(1, int(1000 / self._cached_fps))  # e.g., 60fps -> 16ms, 120fps -> 8ms
-        return 33  # Default to ~30fps if unknown
+        # e.g., 60fps -> 16ms, 120fps -> 8ms; ~30fps if unknown
+        self._cached_frame_ms = max(1, int(1000 / self._cached_fps)) if self._cached_fps else 33
 
     def _frame_step_forward(self):
         """Advance one frame forward based on video fps"""
         if self.player.is_playing():
             self.player.pause()
             self.play_btn.setText("▶  Play")
-        frame_ms = self._get_frame_duration_ms()
+        frame_ms = self._cached_frame_ms
         current = self.player.get_time()
         self.player.set_time(current + frame_ms)
+        self._refresh_playback_ui_soon()
         fps = self._cached_fps or 30
         self.status_label.setText(f"⏭ +1 frame ({fps:.0f}fps)")
-        QTimer.singleShot(1000, self._update_status_bar)
+        self._status_reset_timer.start(1000)
 
     def _frame_step_backward(self):
         """Step backward one frame based on video fps"""
         if self.player.is_playing():
             self.player.pause()
             self.play_btn.setText("▶  Play")
-        frame_ms = self._get_frame_duration_ms()
+        frame_ms = self._cached_frame_ms
         current = self.player.get_time()
         self.player.set_time(max(0, current - frame_ms))
+        self._refresh_playback_ui_soon()
         fps = self._cached_fps or 30
         self.status_label.setText(f"⏮ -1 frame ({fps:.0f}fps)")
-        QTimer.singleShot(1000, self._update_status_bar)
+        self._status_reset_timer.start(1000)
 
     def _set_position(self, position):
         """Set video position from slider"""
         self.player.set_position(position / 1000.0)
+        self._refresh_playback_ui_soon()
         self._session_send_seek(position / 1000.0)
 
     def _slider_pressed(self):
@@ -2732,21 +3226,25 @@ class VideoPlayer(QMainWindow):
 
     def _set_volume(self, volume):
         """Set audio volume"""
+        if volume == self._last_applied_volume:
+            return
+        self._last_applied_volume = volume
         self.player.audio_set_volume(volume)
         self.volume_label.setText(f"{volume}%")
         
-        # Save volume preference
-        self.config_manager.set("volume", volume)
+        # Save volume preference (a drag saves once, on release)
+        if not self.volume_slider.isSliderDown():
+            self._save_volume()
         
         # Update icon based on volume level
-        if volume == 0:
-            self.volume_icon.setText("🔇")
-        elif volume < 33:
-            self.volume_icon.setText("🔈")
-        elif volume < 66:
-            self.volume_icon.setText("🔉")
-        else:
-            self.volume_icon.setText("🔊")
+        icon = next(icon for limit, icon in self._VOL_ICONS if volume < limit)
+        if icon != self._last_vol_icon:
+            self._last_vol_icon = icon
+            self.volume_icon.setText(icon)
+
+    def _save_volume(self):
+        """Persist the current volume slider value"""
+        self.config_manager.set("volume", self.volume_slider.value())
 
     def _toggle_mute(self):
         """Toggle mute state"""
@@ -2756,25 +3254,46 @@ class VideoPlayer(QMainWindow):
         else:
             self.volume_slider.setValue(int(self._last_volume or 80))
 
+    def _volume_up(self):
+        """Raise volume by 5%"""
+        self.volume_slider.setValue(min(100, self.volume_slider.value() + 5))
+
+    def _volume_down(self):
+        """Lower volume by 5%"""
+        self.volume_slider.setValue(max(0, self.volume_slider.value() - 5))
+
     # ========================================================================
     # UI Updates
     # ========================================================================
 
     def _update_playback_ui(self):
         """Update playback-related UI elements"""
+        # Only touch widgets whose value actually changed since the last tick
         if not self.is_slider_pressed:
-            position = self.player.get_position()
-            self.time_slider.setValue(int(position * 1000))
-        
-        current_time = self.player.get_time()
-        duration = self.player.get_length()
-        
-        self.time_label.setText(self._format_time(current_time))
-        self.duration_label.setText(self._format_time(duration))
-        
-        # Handle video end
-        state = self.player.get_state()
-        if state == vlc.State.Ended:
+            slider_pos = int(self.player.get_position() * 1000)
+            if slider_pos != self._last_slider_pos:
+                self._last_slider_pos = slider_pos
+                self.time_slider.setValue(slider_pos)
+        
+        time_text = self._format_time(self.player.get_time())
+        if time_text != self._last_time_text:
+            self._last_time_text = time_text
+            self.time_label.setText(time_text)
+        # Length is fixed per clip: ask VLC only until it is known
+        if self._cached_length <= 0:
+            self._cached_length = self.player.get_length()
+            duration_text = self._format_time(self._cached_length)
+            if duration_text != self._last_duration_text:
+                self._last_duration_text = duration_text
+                self.duration_label.setText(duration_text)
+
+    def _on_clip_ended(self):
+        """Handle the end of the current clip (autoplay or stop).
+
+        Only called from the MediaPlayerEndReached event, never polled. The one
+        get_state() check drops an EndReached that was still queued when the
+        user had already started another clip."""
+        if self.player.get_state() == vlc.State.Ended:
             if self.autoplay_enabled:
                 # In a session, only the host triggers autoplay
                 client = self._get_session_client()
@@ -2789,38 +3308,106 @@ class VideoPlayer(QMainWindow):
                 self.timer.stop()
                 self.play_btn.setText("▶  Play")
 
+    def _on_vlc_callback(self, event_type):
+        """libVLC thread: hand the event to the UI thread. Nothing else runs here;
+        TimeChanged is dropped while a previous tick is still queued."""
+        if event_type == self._vlc_time_changed:
+            if self._time_event_pending:
+                return
+            self._time_event_pending = True
+        self._vlc_event_signal.emit(event_type)
+
+    def _on_vlc_event(self, event_type):
+        """Route a VLC event to its handler (runs on the UI thread)"""
+        handler = self._vlc_handlers.get(event_type)
+        if handler:
+            handler()
+
+    def _on_vlc_time(self):
+        """Refresh slider/time for a TimeChanged tick"""
+        self._time_event_pending = False
+        # get_fps() is often still 0 at parse/Playing time; try once more now
+        # that frames are being decoded
+        if self._fps_retry_pending:
+            self._fps_retry_pending = False
+            if not self._cached_fps:
+                self._cache_fps()
+        if not self.isMinimized():
+            self._update_playback_ui()
+
+    def _on_vlc_playing(self):
+        """Start the fallback UI timer (only runs while something is playing)"""
+        if not self.isMinimized():
+            self.timer.start()
+        # The input is running now, so FPS is known even if parsing reported none
+        if not self._cached_fps:
+            self._cache_fps()
+
+    def _on_vlc_media_parsed(self):
+        """Media metadata is ready — cache FPS without waiting for a fixed delay"""
+        if not self._cached_fps:
+            self._cache_fps()
+
+    def _on_vlc_paused(self):
+        """Stop the UI timer while paused/stopped"""
+        self.timer.stop()
+
+    def _on_vlc_ended(self):
+        """Final UI refresh, then autoplay/stop"""
+        self.timer.stop()
+        if not self.isMinimized():
+            self._update_playback_ui()
+        self._on_clip_ended()
+
+    def _refresh_playback_ui_soon(self):
+        """Refresh slider/time once after a seek while the UI timer is stopped"""
+        if not self.timer.isActive():
+            QTimer.singleShot(60, self._update_playback_ui)
+
     def _update_clip_counter(self):
         """Update the clip counter display"""
         if not self.play_queue:
-             self.clip_counter.setText("0 / 0")
-             return
-             
-        current = self.queue_index + 1
-        total = len(self.play_queue)
-        self.clip_counter.setText(f"{current} / {total}")
+            text = "0 / 0"
+        else:
+            text = f"{self.queue_index + 1} / {len(self.play_queue)}"
+        if text != self.clip_counter.text():
+            self.clip_counter.setText(text)
 
     def _update_status_bar(self):
         """Update the status bar with current state info"""
-        if not self.play_queue:
-            self.status_label.setText("Ready")
-            return
+        # Rebuild the text only when its inputs changed
+        sig = (len(self.play_queue), self.queue_index, self.autoplay_enabled)
+        if sig == self._status_bar_sig:
+            text = self._status_bar_text
+        elif not self.play_queue:
+            text = "Ready"
+        else:
+            remaining = len(self.play_queue) - (self.queue_index + 1)
             
-        remaining = len(self.play_queue) - (self.queue_index + 1)
-        
-        parts = [f"{remaining:,} remaining"]
-        
-        if self.autoplay_enabled:
-            parts.append("Autoplay ON")
+            parts = [f"{remaining:,} remaining"]
+            
+            if self.autoplay_enabled:
+                parts.append("Autoplay ON")
+            text = "  •  ".join(parts)
+        self._status_bar_sig = sig
+        self._status_bar_text = text
         
-        self.status_label.setText("  •  ".join(parts))
+        # Still compare against the label itself: other code writes temporary
+        # messages to it, and this call is what restores the normal text
+        if text != self.status_label.text():
+            self.status_label.setText(text)
 
     @staticmethod
     def _format_time(ms):
         """Format milliseconds to M:SS or H:MM:SS"""
         if ms < 0:
             return "0:00"
-        
-        total_seconds = ms // 1000
+        return VideoPlayer._format_seconds(ms // 1000)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _format_seconds(total_seconds):
+        """M:SS / H:MM:SS for whole seconds (ticks within a second hit the cache)"""
         hours = total_seconds // 3600
         minutes = (total_seconds % 3600) // 60
         seconds = total_seconds % 60
@@ -2833,6 +3420,15 @@ class VideoPlayer(QMainWindow):
     # Event Handlers
     # ========================================================================
 
+    def changeEvent(self, event):
+        """Pause UI updates while minimized, resume on restore"""
+        if event.type() == QEvent.WindowStateChange and hasattr(self, 'timer'):
+            if self.isMinimized():
+                self.timer.stop()
+            elif self.player.is_playing():
+                self.timer.start()
+        super().changeEvent(event)
+
     def mouseMoveEvent(self, event):
         """Handle mouse movement for auto-hide controls"""
         if self.auto_hide_controls:
@@ -2847,15 +3443,29 @@ class VideoPlayer(QMainWindow):
     def _is_mouse_over_video(self, pos):
         """Check if mouse position is over the video frame area"""
         if hasattr(self, 'video_frame'):
-            video_rect = self.video_frame.geometry()
-            # Map to parent coordinates
-            parent = self.video_frame.parent()
-            if parent is None:
-                return True
-            video_global = parent.mapToParent(video_rect.topLeft())
-            video_rect.moveTopLeft(video_global)
+            video_rect = self._cached_video_rect
+            if video_rect is None:
+                video_rect = self.video_frame.geometry()
+                # Map to parent coordinates
+                parent = self.video_frame.parent()
+                if parent is None:
+                    return True
+                video_global = parent.mapToParent(video_rect.topLeft())
+                video_rect.moveTopLeft(video_global)
+                self._cached_video_rect = video_rect
             return video_rect.contains(pos)
         return True
+
+    def eventFilter(self, obj, event):
+        """Drop the cached video rect when the frame or its container moves/resizes"""
+        if event.type() in (QEvent.Resize, QEvent.Move):
+            self._cached_video_rect = None
+        return super().eventFilter(obj, event)
+
+    def resizeEvent(self, event):
+        """Window resizes re-layout everything; recompute the video rect lazily"""
+        self._cached_video_rect = None
+        super().resizeEvent(event)
         
     def enterEvent(self, event):
         """Show controls when mouse enters window"""
@@ -2907,13 +3517,14 @@ class VideoPlayer(QMainWindow):
     def _session_auto_share(self):
         """Upload + share the current clip to the session."""
         client = self._get_session_client()
-        if client and self.current_video and os.path.exists(self.current_video):
+        # The upload thread checks the file exists and reports room_error if not
+        if client and self.current_video:
             self._session_uploading = True
             if DEBUG_MODE:
-                logging.getLogger("rdm").debug(f"Auto-sharing: {self.current_video}")
+                log.debug("Auto-sharing: %s", self.current_video)
             if self._session_panel:
                 self._session_panel.progress_label.setText("⏳ Sharing clip...")
-                self._session_panel.add_activity(f"📤 You shared {os.path.basename(self.current_video)}")
+                self._session_panel.add_activity(f"📤 You shared {self._clip_names(self.current_video)[0]}")
             client.upload_and_play(self.current_video)
 
     def _on_random_clip_requested(self):
@@ -2924,13 +3535,10 @@ class VideoPlayer(QMainWindow):
             self.status_label.setText("⚠ No clips to share")
             return
         # Pick a random clip and share it (don't play locally — wait for all_ready)
-        self.queue_index += 1
-        if self.queue_index >= len(self.play_queue):
-            random.shuffle(self.play_queue)
-            self.queue_index = 0
+        self._advance_queue()
         self.current_video = self.play_queue[self.queue_index]
         self._update_navigation_state()
-        filename = os.path.basename(self.current_video)
+        filename, _ = self._clip_names(self.current_video)
         self.video_label.setText(f"⏳ Uploading: {filename}")
         self.status_label.setText("⏳ Syncing with session...")
         self._session_auto_share()
@@ -2943,17 +3551,33 @@ class VideoPlayer(QMainWindow):
         self._session_menu.setTitle(f"{dot} Session")
 
     def _get_session_client(self):
-        """Get the active session client, or None."""
-        if self._session_panel and self._session_panel.session_client:
-            client = self._session_panel.session_client
-            if client.is_connected:
+        """Get the active session client, or None.
+
+        The lookup is cached until the session panel reports a connection
+        change via _invalidate_session_client()."""
+        if not self._session_client_dirty:
+            client = self._cached_session_client
+            # Cheap guard in case the socket dropped before the panel noticed
+            if client is None or client.is_connected:
                 return client
-        return None
+        client = None
+        if self._session_panel and self._session_panel.session_client:
+            panel_client = self._session_panel.session_client
+            if panel_client.is_connected:
+                client = panel_client
+        self._cached_session_client = client
+        self._session_client_dirty = False
+        return client
+
+    def _invalidate_session_client(self):
+        """Drop the cached session client (connect/disconnect/error)."""
+        self._session_client_dirty = True
 
     def _session_send_play(self):
         """Notify the session that we pressed play."""
         if self._ignore_remote:
             return
+        self._flush_session_sends()
         client = self._get_session_client()
         if client:
             pos = self.player.get_position() or 0.0
@@ -2963,33 +3587,48 @@ class VideoPlayer(QMainWindow):
         """Notify the session that we pressed pause."""
         if self._ignore_remote:
             return
+        self._flush_session_sends()
         client = self._get_session_client()
         if client:
             pos = self.player.get_position() or 0.0
             client.send_pause(pos)
 
     def _session_send_seek(self, position):
-        """Notify the session that we seeked."""
+        """Notify the session that we seeked (coalesced, see _flush_session_sends)."""
         if self._ignore_remote:
             return
-        client = self._get_session_client()
-        if client:
-            client.send_seek(position)
+        if self._get_session_client():
+            self._pending_seek = position
+            if not self._session_send_timer.isActive():
+                self._session_send_timer.start()
 
     def _session_send_speed(self, speed):
-        """Notify the session of speed change."""
+        """Notify the session of speed change (coalesced, see _flush_session_sends)."""
         if self._ignore_remote:
             return
+        if self._get_session_client():
+            self._pending_speed = speed
+            if not self._session_send_timer.isActive():
+                self._session_send_timer.start()
+
+    def _flush_session_sends(self):
+        """Send the latest pending seek/speed; a drag sends at most one per window."""
+        self._session_send_timer.stop()
+        seek, speed = self._pending_seek, self._pending_speed
+        self._pending_seek = self._pending_speed = None
         client = self._get_session_client()
         if client:
-            client.send_speed(speed)
+            if seek is not None:
+                client.send_seek(seek)
+            if speed is not None:
+                client.send_speed(speed)
 
     # ---- Remote event handlers (called by SessionPanel signals) ----
 
     def _on_remote_play(self, position, username):
         """Another user pressed play."""
         if DEBUG_MODE:
-            logging.getLogger("rdm").debug(f"Remote PLAY from {username} at pos={position:.4f}")
+            log.debug("Remote PLAY from %s at pos=%.4f", username, position)
         self._ignore_remote = True
         self.player.set_position(position)
         if not self.player.is_playing():
@@ -2998,7 +3637,7 @@ class VideoPlayer(QMainWindow):
             self.play_btn.setText("⏸  Pause")
             self._apply_current_speed()
         self.status_label.setText(f"▶ {username} pressed play")
-        QTimer.singleShot(2000, self._update_status_bar)
+        self._status_reset_timer.start(2000)
         self._ignore_remote = False
 
     def _on_remote_pause(self, position, username):
@@ -3008,16 +3647,18 @@ class VideoPlayer(QMainWindow):
             self.player.pause()
             self.play_btn.setText("▶  Play")
         self.player.set_position(position)
+        self._refresh_playback_ui_soon()
         self.status_label.setText(f"⏸ {username} paused")
-        QTimer.singleShot(2000, self._update_status_bar)
+        self._status_reset_timer.start(2000)
         self._ignore_remote = False
 
     def _on_remote_seek(self, position, username):
         """Another user seeked."""
         self._ignore_remote = True
         self.player.set_position(position)
+        self._refresh_playback_ui_soon()
         self.status_label.setText(f"⏩ {username} seeked")
-        QTimer.singleShot(2000, self._update_status_bar)
+        self._status_reset_timer.start(2000)
         self._ignore_remote = False
 
     def _on_remote_speed(self, speed, username):
@@ -3026,13 +3667,13 @@ class VideoPlayer(QMainWindow):
         self.player.set_rate(speed)
         self.slow_mo_btn.set_speed(speed)
         self.status_label.setText(f"Speed: {speed}x by {username}")
-        QTimer.singleShot(2000, self._update_status_bar)
+        self._status_reset_timer.start(2000)
         self._ignore_remote = False
 
     def _on_remote_play_video(self, video_id, filename, username):
         """Another user wants to play a video — download it."""
         if DEBUG_MODE:
-            logging.getLogger("rdm").debug(f"Remote PLAY_VIDEO from {username}: {filename} (id={video_id})")
+            log.debug("Remote PLAY_VIDEO from %s: %s (id=%s)", username, filename, video_id)
         self.status_label.setText(f"📥 {username} is sharing: {filename}")
         client = self._get_session_client()
         if client:
@@ -3043,27 +3684,31 @@ class VideoPlayer(QMainWindow):
             # Otherwise download_video was already triggered by session_client
 
     def _play_session_video(self, video_id, local_path):
-        """Play a session video that has been downloaded locally."""
-        if os.path.exists(local_path):
-            self._ignore_remote = True
-            self._playing_remote_clip = True  # Don't re-share when this clip ends
-            self.current_video = local_path
-            self._play_video(local_path)
-            self._ignore_remote = False
+        """Play a session video that has been downloaded locally.
+        local_path comes from session_client: its download thread stats the
+        file before emitting video_ready, while get_local_video_path trusts
+        the cached flag. No filesystem calls here."""
+        self._ignore_remote = True
+        self._playing_remote_clip = True  # Don't re-share when this clip ends
+        self.current_video = local_path
+        self._play_video(local_path)
+        self._ignore_remote = False
 
     def _load_session_video(self, local_path):
         """Load a session video into the player but don't start playback.
         Used for ready-sync: load the video, pause, then wait for all_ready."""
-        if os.path.exists(local_path):
-            self._ignore_remote = True
-            self.current_video = local_path
-            self._play_video(local_path)
-            self._ignore_remote = False
+        self._ignore_remote = True
+        self.current_video = local_path
+        self._play_video(local_path)
+        self._ignore_remote = False
 
     def closeEvent(self, event):
         """Clean up on window close"""
         self.timer.stop()
         self.hide_controls_timer.stop()
+        # Flush pending (debounced) writes before the event loop goes away
+        self.config_manager.flush()
+        self._save_queue_state()
         if hasattr(self, '_controls_animation'):
             self._controls_animation.stop()
         # Clean up session
@@ -3093,7 +3738,6 @@ def _setup_debug():
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
         datefmt="%H:%M:%S",
     )
-    log = logging.getLogger("rdm")
     log.info("Debug mode enabled")
 
     # Also crank up session_client logging
@@ -3135,9 +3779,9 @@ def main():
     # Debug overlay: show a small label in the title bar
     if DEBUG_MODE:
         player.setWindowTitle("Random Clip Player v4.5 [DEBUG]")
-        logging.getLogger("rdm").info(f"VLC version: {vlc.libvlc_get_version()}")
-        logging.getLogger("rdm").info(f"Python: {sys.version}")
-        logging.getLogger("rdm").info(f"Session module: {'available' if SESSION_AVAILABLE else 'NOT available'}")
+        log.info("VLC version: %s", vlc.libvlc_get_version())
+        log.info("Python: %s", sys.version)
+        log.info("Session module: %s", "available" if SESSION_AVAILABLE else "NOT available")
 
     player.show()
     
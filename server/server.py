@@ -11,29 +11,33 @@ Features:
 """
 
 import os
+import re
 import sys
-import json
 import time
 import uuid
-import string
 import random
+import base64
 import asyncio
 import hashlib
+import hmac
+import heapq
 import logging
 import secrets
 import shutil
 from pathlib import Path
 from typing import Optional
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
 
 import bcrypt
-import aiofiles
+import orjson
 from fastapi import (
     FastAPI, WebSocket, WebSocketDisconnect,
     HTTPException, UploadFile, File, Form, Request,
 )
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.responses import StreamingResponse, ORJSONResponse, FileResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 # ============================================================================
@@ -44,10 +48,30 @@ SERVER_HOST = os.getenv("RDM_HOST", "0.0.0.0")
 SERVER_PORT = int(os.getenv("RDM_PORT", "8765"))
 UPLOAD_DIR = Path(os.getenv("RDM_UPLOAD_DIR", "./uploads"))
 MAX_FILE_SIZE = int(os.getenv("RDM_MAX_FILE_SIZE_MB", "500")) * 1024 * 1024  # bytes
+UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024  # 4MB per read/write while saving uploads
+STREAM_CHUNK_SIZE = 4 * 1024 * 1024  # Range reads are served from cached blocks of this size
+STREAM_CACHE_MB = int(os.getenv("RDM_STREAM_CACHE_MB", "256"))  # 0 disables the block cache
 ROOM_EXPIRY_SECONDS = int(os.getenv("RDM_ROOM_EXPIRY_SECONDS", "14400"))  # 4 hours
 CLEANUP_INTERVAL = 300  # 5 minutes
+CLEANUP_UNLINK_CONCURRENCY = 8  # Parallel file deletes when removing a room's uploads
 MAX_JOIN_ATTEMPTS = 5
 JOIN_LOCKOUT_SECONDS = 60
+SEEK_COALESCE_SECONDS = 0.05  # Scrubbing seeks from one user are broadcast at most this often
+PASSWORD_CACHE_SECONDS = 300  # Reuse a successful bcrypt check for this long
+BCRYPT_WORKERS = os.cpu_count() or 4  # bcrypt is CPU-bound: one thread per core
+# Room passwords are short-lived shared secrets, not account credentials;
+# cost 8 is ~16x cheaper than bcrypt's default of 12
+ROOM_BCRYPT_COST = int(os.getenv("RDM_BCRYPT_COST", "8"))
+if not 4 <= ROOM_BCRYPT_COST <= 31:
+    # Fail at startup rather than on every POST /rooms in bcrypt.gensalt
+    raise ValueError(f"RDM_BCRYPT_COST must be between 4 and 31, got {ROOM_BCRYPT_COST}")
+
+CONTENT_TYPES = {
+    ".mp4": "video/mp4", ".webm": "video/webm", ".mkv": "video/x-matroska",
+    ".avi": "video/x-msvideo", ".mov": "video/quicktime", ".flv": "video/x-flv",
+    ".wmv": "video/x-ms-wmv", ".m4v": "video/x-m4v",
+}
+_RANGE_RE = re.compile(r"\s*bytes=(\d*)-(\d*)")
 
 # Logging
 logging.basicConfig(
@@ -61,16 +85,7 @@ log = logging.getLogger("rdm-server")
 # Data Models
 # ============================================================================
 
-@dataclass
-class User:
-    """A connected user in a room."""
-    user_id: str
-    username: str
-    websocket: WebSocket
-    joined_at: float = field(default_factory=time.time)
-
-
-@dataclass
+@dataclass(slots=True)
 class Room:
     """A watch-together session room."""
     room_code: str
@@ -78,12 +93,18 @@ class Room:
     host_id: str
     created_at: float = field(default_factory=time.time)
     last_activity: float = field(default_factory=time.time)
-    users: dict = field(default_factory=dict)          # user_id -> User
+    # Connected users as parallel lists (index i is one user) so broadcasts
+    # walk a flat list of sockets; _idx maps user_id -> index
+    _user_ids: list = field(default_factory=list)
+    _usernames: list = field(default_factory=list)
+    _websockets: list = field(default_factory=list)
+    _idx: dict = field(default_factory=dict)
     current_video: Optional[str] = None                # video_id of active clip
-    videos: dict = field(default_factory=dict)          # video_id -> file metadata
+    videos: dict = field(default_factory=dict)          # video_id -> file metadata (add via add_video)
+    _video_list: Optional[dict] = None                  # Cached client-facing summary of videos
     shared_pool: bool = False                           # Shared random pool mode
     pending_video: Optional[str] = None                  # video_id waiting for all users to be ready
-    ready_users: set = field(default_factory=set)         # user_ids that reported ready for pending_video
+    ready_mask: int = 0                                   # bit i set = user slot i is ready for pending_video
     playback_state: dict = field(default_factory=lambda: {
         "playing": False,
         "position": 0.0,       # 0.0 - 1.0
@@ -92,108 +113,360 @@ class Room:
     })
 
     def touch(self):
-        self.last_activity = time.time()
+        # Called on every signaling message; second granularity is plenty
+        # for an expiry measured in hours
+        now = time.time()
+        if now - self.last_activity > 1.0:
+            self.last_activity = now
 
     @property
     def is_expired(self) -> bool:
         return (time.time() - self.last_activity) > ROOM_EXPIRY_SECONDS
 
+    @property
+    def user_count(self) -> int:
+        return len(self._user_ids)
+
+    def has_user(self, user_id: str) -> bool:
+        return user_id in self._idx
+
+    def username_of(self, user_id: str) -> Optional[str]:
+        i = self._idx.get(user_id)
+        return self._usernames[i] if i is not None else None
+
+    def websocket_of(self, user_id: str) -> Optional[WebSocket]:
+        i = self._idx.get(user_id)
+        return self._websockets[i] if i is not None else None
+
+    def add_user(self, user_id: str, username: str, websocket: WebSocket):
+        """Register a user; a reconnect with the same user_id replaces its socket."""
+        i = self._idx.get(user_id)
+        if i is None:
+            self._idx[user_id] = len(self._user_ids)
+            self._user_ids.append(user_id)
+            self._usernames.append(username)
+            self._websockets.append(websocket)
+        else:
+            self._usernames[i] = username
+            self._websockets[i] = websocket
+
+    def remove_user(self, user_id: str) -> Optional[str]:
+        """Remove a user (swap with the last slot, then pop). Returns the username."""
+        i = self._idx.pop(user_id, None)
+        if i is None:
+            return None
+        username = self._usernames[i]
+        last = len(self._user_ids) - 1
+        # Clear the leaving slot's ready bit, then carry the last slot's bit into it
+        mask = self.ready_mask & ~(1 << i)
+        if i != last:
+            moved = self._user_ids[last]
+            self._user_ids[i] = moved
+            self._usernames[i] = self._usernames[last]
+            self._websockets[i] = self._websockets[last]
+            self._idx[moved] = i
+            if mask >> last & 1:
+                mask = (mask & ~(1 << last)) | (1 << i)
+        self.ready_mask = mask
+        self._user_ids.pop()
+        self._usernames.pop()
+        self._websockets.pop()
+        return username
+
+    def reset_ready(self, user_id: str):
+        """Start a new ready round with only user_id marked ready."""
+        i = self._idx.get(user_id)
+        self.ready_mask = 1 << i if i is not None else 0
+
+    def mark_ready(self, user_id: str):
+        i = self._idx.get(user_id)
+        if i is not None:
+            self.ready_mask |= 1 << i
+
+    @property
+    def ready_count(self) -> int:
+        # remove_user keeps the mask in step with the member slots, so there
+        # is no stale-id set to intersect with the current users
+        return self.ready_mask.bit_count()
+
+    @property
+    def all_ready(self) -> bool:
+        return self.ready_mask == (1 << len(self._user_ids)) - 1
+
     def user_list(self) -> list:
         return [
-            {"user_id": u.user_id, "username": u.username}
-            for u in self.users.values()
+            {"user_id": uid, "username": name}
+            for uid, name in zip(self._user_ids, self._usernames)
         ]
 
+    def add_video(self, video_id: str, meta: dict):
+        self.videos[video_id] = meta
+        self._video_list = None
+
+    def video_list(self) -> dict:
+        """video_id -> {filename, size} as sent to clients; rebuilt only after an upload."""
+        if self._video_list is None:
+            self._video_list = {
+                vid: {"filename": meta["filename"], "size": meta["size"]}
+                for vid, meta in self.videos.items()
+            }
+        return self._video_list
+
+    def websockets(self) -> list:
+        """Snapshot of every connected socket, safe to iterate across awaits."""
+        return list(self._websockets)
+
+    def recipients(self, exclude_id: str = None) -> list:
+        """Snapshot of (user_id, websocket) pairs, optionally skipping one user."""
+        return [(uid, ws) for uid, ws in zip(self._user_ids, self._websockets) if uid != exclude_id]
+
 
 # ============================================================================
 # State Management
 # ============================================================================
 
+# bcrypt releases the GIL, so hashes run truly in parallel here. A dedicated
+# pool keeps a burst of joins from occupying the default executor that
+# file streaming and cleanup also use.
+bcrypt_executor = ThreadPoolExecutor(max_workers=BCRYPT_WORKERS, thread_name_prefix="bcrypt")
+
+
+async def run_bcrypt(func, *args):
+    """Run a bcrypt call on bcrypt_executor without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(bcrypt_executor, func, *args)
+
+
 class ServerState:
     """Global server state — rooms, rate limits, etc."""
 
     def __init__(self):
         self.rooms: dict[str, Room] = {}
-        self.join_attempts: dict[str, list[float]] = {}  # ip -> [timestamps]
+        # (earliest possible expiry, room_code) min-heap; touch() doesn't update
+        # it, so due entries are re-checked and pushed back if still active
+        self.expiry_heap: list[tuple[float, str]] = []
+        self.join_attempts: dict[str, deque] = {}  # ip -> recent attempt timestamps (oldest first)
+        # room_code -> (HMAC of the correct password, expires_at); skips bcrypt on rejoin
+        self.pw_cache: dict[str, tuple[bytes, float]] = {}
+        self._pw_cache_secret = secrets.token_bytes(32)  # Per-process HMAC key
+
+    def _password_key(self, room: Room, password: bytes) -> bytes:
+        return hmac.new(self._pw_cache_secret, room.password_hash + b"\0" + password, "sha256").digest()
 
     def generate_room_code(self) -> str:
-        """Generate a unique room code like 'ABCDE-12345-FGHIJ'."""
+        """Generate a unique room code like 'K3MZQ-7TBWA-XF2RD'."""
         while True:
-            p1 = ''.join(random.choices(string.ascii_uppercase, k=5))
-            p2 = ''.join(random.choices(string.digits, k=5))
-            p3 = ''.join(random.choices(string.ascii_uppercase, k=5))
-            code = f"{p1}-{p2}-{p3}"
+            # 10 random bytes -> exactly 16 base32 chars (A-Z, 2-7), no padding
+            b32 = base64.b32encode(secrets.token_bytes(10)).decode()
+            code = f"{b32[:5]}-{b32[5:10]}-{b32[10:15]}"
             if code not in self.rooms:
                 return code
 
-    def create_room(self, password: str, host_id: str) -> Room:
+    async def create_room(self, password: bytes, host_id: str) -> Room:
+        # bcrypt is deliberately slow — hash on a worker thread, not the event loop
+        pw_hash = await run_bcrypt(bcrypt.hashpw, password, bcrypt.gensalt(rounds=ROOM_BCRYPT_COST))
         code = self.generate_room_code()
-        pw_hash = bcrypt.hashpw(password.encode(), bcrypt.gensalt())
         room = Room(room_code=code, password_hash=pw_hash, host_id=host_id)
         self.rooms[code] = room
+        heapq.heappush(self.expiry_heap, (room.last_activity + ROOM_EXPIRY_SECONDS, code))
+        self.pw_cache[code] = (self._password_key(room, password), time.time() + PASSWORD_CACHE_SECONDS)
         # Create upload directory for this room
         room_dir = UPLOAD_DIR / code
         room_dir.mkdir(parents=True, exist_ok=True)
         log.info(f"Room created: {code}")
         return room
 
-    def verify_password(self, room_code: str, password: str) -> bool:
+    async def verify_password(self, room_code: str, password: bytes) -> bool:
         room = self.rooms.get(room_code)
         if not room:
             return False
-        return bcrypt.checkpw(password.encode(), room.password_hash)
+        key = self._password_key(room, password)
+        cached = self.pw_cache.get(room_code)
+        if cached and cached[1] > time.time() and hmac.compare_digest(cached[0], key):
+            return True
+        ok = await run_bcrypt(bcrypt.checkpw, password, room.password_hash)
+        if ok and room_code in self.rooms:
+            self.pw_cache[room_code] = (key, time.time() + PASSWORD_CACHE_SECONDS)
+        return ok
 
     def check_rate_limit(self, ip: str) -> bool:
         """Returns True if the IP is allowed to attempt joining."""
+        attempts = self.join_attempts.get(ip)
+        if not attempts:
+            return True
+        # Drop attempts outside the lockout window (they are oldest-first)
         now = time.time()
-        attempts = self.join_attempts.get(ip, [])
-        # Remove old attempts outside the lockout window
-        attempts = [t for t in attempts if now - t < JOIN_LOCKOUT_SECONDS]
-        self.join_attempts[ip] = attempts
+        while attempts and now - attempts[0] >= JOIN_LOCKOUT_SECONDS:
+            attempts.popleft()
         return len(attempts) < MAX_JOIN_ATTEMPTS
 
     def record_join_attempt(self, ip: str):
-        attempts = self.join_attempts.setdefault(ip, [])
+        # Only the newest MAX_JOIN_ATTEMPTS matter for the limit
+        attempts = self.join_attempts.setdefault(ip, deque(maxlen=MAX_JOIN_ATTEMPTS))
         attempts.append(time.time())
 
     async def delete_room(self, room_code: str):
         """Delete a room and clean up its files."""
         if room_code in self.rooms:
             del self.rooms[room_code]
-        room_dir = UPLOAD_DIR / room_code
-        if room_dir.exists():
-            await asyncio.to_thread(shutil.rmtree, room_dir, ignore_errors=True)
+        self.pw_cache.pop(room_code, None)
+        block_cache.drop_room(room_code)
+        await remove_upload_dir(UPLOAD_DIR / room_code)
         log.info(f"Room deleted: {room_code}")
 
     async def cleanup_expired(self):
         """Remove expired rooms and their files."""
-        expired = [code for code, room in self.rooms.items() if room.is_expired]
+        # Only rooms whose heap entry is due can have expired
+        now = time.time()
+        expired = []
+        while self.expiry_heap and self.expiry_heap[0][0] < now:
+            _, code = heapq.heappop(self.expiry_heap)
+            room = self.rooms.get(code)
+            if room is None:
+                continue  # Already deleted
+            if room.is_expired:
+                expired.append(code)
+            else:
+                heapq.heappush(self.expiry_heap, (room.last_activity + ROOM_EXPIRY_SECONDS, code))
         for code in expired:
             # Disconnect remaining users
-            room = self.rooms[code]
-            for user in list(room.users.values()):
+            room = self.rooms.get(code)
+            if room is None:
+                continue
+            for ws in room.websockets():
                 try:
-                    await user.websocket.close(1000, "Room expired")
+                    await ws.close(1000, "Room expired")
                 except Exception:
                     pass
             await self.delete_room(code)
         if expired:
             log.info(f"Cleaned up {len(expired)} expired room(s)")
             
-        # Clean up old join attempts
+        # Forget IPs whose newest attempt is outside the lockout window; older
+        # entries of live IPs are trimmed lazily by check_rate_limit
         now = time.time()
-        stale_ips = []
-        for ip, attempts in self.join_attempts.items():
-            valid_attempts = [t for t in attempts if now - t < JOIN_LOCKOUT_SECONDS]
-            if valid_attempts:
-                self.join_attempts[ip] = valid_attempts
-            else:
-                stale_ips.append(ip)
-        for ip in stale_ips:
-            del self.join_attempts[ip]
+        self.join_attempts = {
+            ip: attempts for ip, attempts in self.join_attempts.items()
+            if attempts and now - attempts[-1] < JOIN_LOCKOUT_SECONDS
+        }
+
+
+async def remove_upload_dir(room_dir: Path):
+    """Delete a room's upload directory without blocking the event loop.
+
+    Large clips can take a while to unlink, so files are removed on worker
+    threads, a few at a time, before the (now empty) directory goes.
+    """
+    try:
+        paths = await asyncio.to_thread(lambda: list(room_dir.iterdir()))
+    except FileNotFoundError:
+        return
+    sem = asyncio.Semaphore(CLEANUP_UNLINK_CONCURRENCY)
+
+    async def unlink(path: Path):
+        async with sem:
+            await asyncio.to_thread(path.unlink, missing_ok=True)
+
+    # Failures (e.g. a stray subdirectory) are left for the rmtree below
+    await asyncio.gather(*(unlink(p) for p in paths), return_exceptions=True)
+    await asyncio.to_thread(shutil.rmtree, room_dir, ignore_errors=True)
+
+
+def copy_upload(src, filepath: Path):
+    """Copy an uploaded file object to disk (blocking; run on a worker thread)."""
+    with open(filepath, "wb") as dest:
+        shutil.copyfileobj(src, dest, UPLOAD_CHUNK_SIZE)
+
+
+def _read_at(f, offset: int, size: int) -> bytes:
+    """Seek and read in one call so a block costs a single thread hop."""
+    f.seek(offset)
+    return f.read(size)
+
+
+class BlockCache:
+    """LRU cache of fixed-size video file blocks for HTTP range requests.
+
+    Seeking back re-requests ranges that were just sent; serving them from
+    memory avoids re-opening and re-reading the file for every request.
+    """
+
+    def __init__(self, max_bytes: int, block_size: int = STREAM_CHUNK_SIZE):
+        self.block_size = block_size
+        self.max_blocks = max_bytes // block_size
+        self._blocks: OrderedDict = OrderedDict()  # (room_code, video_id, index) -> bytes
+
+    async def read_range(self, key: tuple, filepath: Path, start: int, end: int):
+        """Yield the bytes start..end (inclusive) of a file, block by block."""
+        first, last = start // self.block_size, end // self.block_size
+        f = None
+        try:
+            for index in range(first, last + 1):
+                block = self._blocks.get(key + (index,))
+                if block is not None:
+                    self._blocks.move_to_end(key + (index,))
+                else:
+                    if f is None:
+                        f = await asyncio.to_thread(open, filepath, "rb")
+                    block = await asyncio.to_thread(_read_at, f, index * self.block_size, self.block_size)
+                    if not block:
+                        break
+                    self._store(key + (index,), block)
+                # Trim the first/last block to the requested range
+                base = index * self.block_size
+                lo = start - base if index == first else 0
+                hi = end - base + 1 if index == last else len(block)
+                yield block[lo:hi]
+        finally:
+            if f is not None:
+                await asyncio.to_thread(f.close)
+
+    def _store(self, key: tuple, block: bytes):
+        if self.max_blocks <= 0:
+            return
+        self._blocks[key] = block
+        while len(self._blocks) > self.max_blocks:
+            self._blocks.popitem(last=False)
+
+    def drop_room(self, room_code: str):
+        """Forget every cached block belonging to a room."""
+        for key in [k for k in self._blocks if k[0] == room_code]:
+            del self._blocks[key]
+
+
+class RangeResponse(StreamingResponse):
+    """206 response that lets the server sendfile() the range when it can.
+
+    ASGI servers that advertise the "http.response.zerocopysend" extension
+    get the open file, offset and count and copy it in the kernel; others
+    (uvicorn included) stream the range from the block cache instead.
+    """
+
+    def __init__(self, filepath: Path, start: int, count: int, content, **kwargs):
+        super().__init__(content, **kwargs)
+        self.filepath = filepath
+        self.start = start
+        self.count = count
+
+    async def __call__(self, scope, receive, send):
+        if "http.response.zerocopysend" not in scope.get("extensions", {}):
+            await super().__call__(scope, receive, send)
+            return
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        f = await asyncio.to_thread(open, self.filepath, "rb")
+        try:
+            await send({
+                "type": "http.response.zerocopysend",
+                "file": f,
+                "offset": self.start,
+                "count": self.count,
+                "more_body": False,
+            })
+        finally:
+            await asyncio.to_thread(f.close)
 
 
 state = ServerState()
+block_cache = BlockCache(STREAM_CACHE_MB * 1024 * 1024)
 
 # ============================================================================
 # Background Tasks
@@ -214,6 +487,7 @@ async def lifespan(app: FastAPI):
     log.info(f"Server started on {SERVER_HOST}:{SERVER_PORT}")
     yield
     task.cancel()
+    bcrypt_executor.shutdown(wait=False)
     log.info("Server shutting down")
 
 
@@ -221,7 +495,7 @@ async def lifespan(app: FastAPI):
 # FastAPI App
 # ============================================================================
 
-app = FastAPI(title="RDM Watch Together Server", lifespan=lifespan)
+app = FastAPI(title="RDM Watch Together Server", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -253,7 +527,7 @@ async def create_room(request: Request):
         raise HTTPException(400, "Username required (max 32 chars)")
 
     user_id = secrets.token_hex(8)
-    room = state.create_room(password, host_id=user_id)
+    room = await state.create_room(password.encode(), host_id=user_id)
 
     return {
         "room_code": room.room_code,
@@ -273,18 +547,20 @@ async def join_room(room_code: str, request: Request):
     state.record_join_attempt(client_ip)
 
     body = await request.json()
-    password = body.get("password", "")
+    password = body.get("password", "").encode()  # Encoded once for both cache key and bcrypt
     username = body.get("username", "").strip()
 
     if room_code not in state.rooms:
         raise HTTPException(404, "Room not found")
     if not username or len(username) > 32:
         raise HTTPException(400, "Username required (max 32 chars)")
-    if not state.verify_password(room_code, password):
+    if not await state.verify_password(room_code, password):
         raise HTTPException(403, "Incorrect password")
 
     user_id = secrets.token_hex(8)
-    room = state.rooms[room_code]
+    room = state.rooms.get(room_code)
+    if not room:  # Expired while the password was being checked
+        raise HTTPException(404, "Room not found")
     room.touch()
 
     return {
@@ -294,10 +570,7 @@ async def join_room(room_code: str, request: Request):
         "users": room.user_list(),
         "playback_state": room.playback_state,
         "current_video": room.current_video,
-        "videos": {
-            vid: {"filename": meta["filename"], "size": meta["size"]}
-            for vid, meta in room.videos.items()
-        },
+        "videos": room.video_list(),
     }
 
 
@@ -312,11 +585,15 @@ async def upload_video(
         raise HTTPException(404, "Room not found")
 
     room = state.rooms[room_code]
-    if user_id not in room.users:
+    if not room.has_user(user_id):
         raise HTTPException(403, "Not a member of this room")
 
     room.touch()
 
+    # Reject oversized uploads before touching the disk when the size is known
+    if file.size is not None and file.size > MAX_FILE_SIZE:
+        raise HTTPException(413, f"File too large (max {MAX_FILE_SIZE // (1024*1024)}MB)")
+
     # Generate a unique video ID
     video_id = secrets.token_hex(8)
     safe_filename = f"{video_id}_{file.filename}"
@@ -324,22 +601,25 @@ async def upload_video(
     room_dir.mkdir(parents=True, exist_ok=True)
     filepath = room_dir / safe_filename
 
-    # Stream upload to disk with size check
     total_size = 0
-    chunk_size = 1024 * 256  # 256KB chunks
 
     try:
-        async with aiofiles.open(filepath, "wb") as f:
-            while True:
-                chunk = await file.read(chunk_size)
-                if not chunk:
-                    break
-                total_size += len(chunk)
-                if total_size > MAX_FILE_SIZE:
-                    await f.close()
-                    filepath.unlink(missing_ok=True)
-                    raise HTTPException(413, f"File too large (max {MAX_FILE_SIZE // (1024*1024)}MB)")
-                await f.write(chunk)
+        if file.size is not None:
+            # Size already checked above: copy the spooled upload in one
+            # thread hop instead of awaiting every chunk
+            await asyncio.to_thread(copy_upload, file.file, filepath)
+            total_size = file.size
+        else:
+            # Unknown size: stream to disk with a running size check
+            f = await asyncio.to_thread(open, filepath, "wb")
+            try:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    total_size += len(chunk)
+                    if total_size > MAX_FILE_SIZE:
+                        raise HTTPException(413, f"File too large (max {MAX_FILE_SIZE // (1024*1024)}MB)")
+                    await asyncio.to_thread(f.write, chunk)
+            finally:
+                await asyncio.to_thread(f.close)
     except Exception as e:
         filepath.unlink(missing_ok=True)
         if isinstance(e, HTTPException):
@@ -347,17 +627,17 @@ async def upload_video(
         raise HTTPException(500, "Upload failed")
 
     # Store metadata
-    room.videos[video_id] = {
+    room.add_video(video_id, {
         "filename": file.filename,
         "safe_filename": safe_filename,
         "size": total_size,
+        "content_type": CONTENT_TYPES.get(Path(file.filename).suffix.lower(), "application/octet-stream"),
         "uploaded_by": user_id,
         "uploaded_at": time.time(),
-    }
+    })
 
     # Notify all room members about the new video
-    uploader = room.users.get(user_id)
-    uploader_name = uploader.username if uploader else "Unknown"
+    uploader_name = room.username_of(user_id) or "Unknown"
 
     await broadcast(room, {
         "type": "video_uploaded",
@@ -383,69 +663,55 @@ async def stream_video(room_code: str, video_id: str, request: Request):
     if not video_meta:
         raise HTTPException(404, "Video not found")
 
+    # Size and type were recorded at upload; uploads are immutable and only
+    # deleted together with their room, so no per-request stat() is needed
     filepath = UPLOAD_DIR / room_code / video_meta["safe_filename"]
-    if not filepath.exists():
-        raise HTTPException(404, "Video file missing")
-
-    file_size = filepath.stat().st_size
+    file_size = video_meta["size"]
+    content_type = video_meta["content_type"]
     range_header = request.headers.get("range")
-
-    # Determine content type
-    ext = Path(video_meta["filename"]).suffix.lower()
-    content_types = {
-        ".mp4": "video/mp4", ".webm": "video/webm", ".mkv": "video/x-matroska",
-        ".avi": "video/x-msvideo", ".mov": "video/quicktime", ".flv": "video/x-flv",
-        ".wmv": "video/x-ms-wmv", ".m4v": "video/x-m4v",
-    }
-    content_type = content_types.get(ext, "application/octet-stream")
-
-    if range_header:
-        # Parse range request
-        range_val = range_header.strip().replace("bytes=", "")
-        range_parts = range_val.split("-")
-        start = int(range_parts[0]) if range_parts[0] else 0
-        end = int(range_parts[1]) if range_parts[1] else file_size - 1
-        end = min(end, file_size - 1)
+    # A malformed Range header (including "bytes=-") falls through to the full response
+    range_match = _RANGE_RE.match(range_header) if range_header else None
+    if range_match and not any(range_match.groups()):
+        range_match = None
+
+    if range_match:
+        start_str, end_str = range_match.groups()
+        if start_str:
+            start = int(start_str)
+            end = min(int(end_str), file_size - 1) if end_str else file_size - 1
+        else:
+            # Suffix form "bytes=-N": the last N bytes
+            start = max(0, file_size - int(end_str))
+            end = file_size - 1
+        if start >= file_size or start > end:
+            return Response(
+                status_code=416,
+                headers={"Content-Range": f"bytes */{file_size}", "Accept-Ranges": "bytes"},
+            )
         content_length = end - start + 1
 
-        async def ranged_file():
-            async with aiofiles.open(filepath, "rb") as f:
-                await f.seek(start)
-                remaining = content_length
-                while remaining > 0:
-                    chunk_sz = min(65536, remaining)
-                    data = await f.read(chunk_sz)
-                    if not data:
-                        break
-                    remaining -= len(data)
-                    yield data
-
-        return StreamingResponse(
-            ranged_file(),
+        return RangeResponse(
+            filepath, start, content_length,
+            block_cache.read_range((room_code, video_id), filepath, start, end),
             status_code=206,
             headers={
                 "Content-Range": f"bytes {start}-{end}/{file_size}",
                 "Accept-Ranges": "bytes",
                 "Content-Length": str(content_length),
                 "Content-Type": content_type,
+                # Uploaded clips never change under a video_id
+                "Cache-Control": "public, max-age=3600",
             },
         )
     else:
-        # Full file response
-        async def full_file():
-            async with aiofiles.open(filepath, "rb") as f:
-                while True:
-                    data = await f.read(65536)
-                    if not data:
-                        break
-                    yield data
-
-        return StreamingResponse(
-            full_file(),
+        # Full file response: FileResponse can hand the file to the transport
+        # (sendfile) instead of copying chunks through Python
+        return FileResponse(
+            filepath,
+            media_type=content_type,
             headers={
-                "Content-Length": str(file_size),
-                "Content-Type": content_type,
                 "Accept-Ranges": "bytes",
+                "Cache-Control": "public, max-age=3600",
             },
         )
 
@@ -454,20 +720,43 @@ async def stream_video(room_code: str, video_id: str, request: Request):
 # WebSocket — Real-time Signaling
 # ============================================================================
 
+# Fixed-payload frames, encoded once at import
+PONG_FRAME = orjson.dumps({"type": "pong"}).decode()
+ERROR_FRAMES = {
+    text: orjson.dumps({"type": "error", "message": text}).decode()
+    for text in (
+        "Room not found",
+        "Auth required",
+        "Invalid user_id",
+        "Only the host can kick users",
+        "Only the host can change pool mode",
+    )
+}
+
+
+async def send_message(ws: WebSocket, message: dict):
+    """Send a JSON message as a text frame, serialized with orjson."""
+    await ws.send_text(orjson.dumps(message).decode())
+
+
+async def receive_message(ws: WebSocket) -> dict:
+    """Receive a text frame and parse it with orjson."""
+    return orjson.loads(await ws.receive_text())
+
+
 async def broadcast(room: Room, message: dict, exclude_id: str = None):
     """Send a message to all users in a room, optionally excluding one."""
-    data = json.dumps(message)
-    disconnected = []
-    for uid, user in room.users.items():
-        if uid == exclude_id:
-            continue
-        try:
-            await user.websocket.send_text(data)
-        except Exception:
-            disconnected.append(uid)
+    data = orjson.dumps(message).decode()
+    # Snapshot: users can join/leave while the sends are awaiting
+    recipients = room.recipients(exclude_id)
+    # Send to everyone concurrently so one slow client doesn't delay the rest
+    results = await asyncio.gather(
+        *(ws.send_text(data) for _, ws in recipients), return_exceptions=True,
+    )
     # Clean up disconnected users
-    for uid in disconnected:
-        room.users.pop(uid, None)
+    for (uid, _), result in zip(recipients, results):
+        if isinstance(result, Exception):
+            room.remove_user(uid)
 
 
 async def _ready_timeout(room: Room, video_id: str, timeout: float):
@@ -491,18 +780,37 @@ async def websocket_endpoint(websocket: WebSocket, room_code: str):
     await websocket.accept()
 
     if room_code not in state.rooms:
-        await websocket.send_json({"type": "error", "message": "Room not found"})
+        await websocket.send_text(ERROR_FRAMES["Room not found"])
         await websocket.close()
         return
 
     room = state.rooms[room_code]
     user_id = None
+    # Latest seek from this user not yet broadcast, the timer that sends it,
+    # and the task the timer started (kept so it isn't garbage collected)
+    pending_seek: Optional[dict] = None
+    seek_timer: Optional[asyncio.TimerHandle] = None
+    seek_task: Optional[asyncio.Task] = None
+
+    async def flush_seek():
+        nonlocal pending_seek, seek_timer
+        if seek_timer is not None:
+            seek_timer.cancel()
+            seek_timer = None
+        message, pending_seek = pending_seek, None
+        if message is not None:
+            await broadcast(room, message, exclude_id=user_id)
+
+    def on_seek_timer():
+        nonlocal seek_timer, seek_task
+        seek_timer = None
+        seek_task = asyncio.create_task(flush_seek())
 
     try:
         # First message must be authentication
-        auth_data = await asyncio.wait_for(websocket.receive_json(), timeout=10)
+        auth_data = await asyncio.wait_for(receive_message(websocket), timeout=10)
         if auth_data.get("type") != "auth":
-            await websocket.send_json({"type": "error", "message": "Auth required"})
+            await websocket.send_text(ERROR_FRAMES["Auth required"])
             await websocket.close()
             return
 
@@ -510,26 +818,22 @@ async def websocket_endpoint(websocket: WebSocket, room_code: str):
         username = auth_data.get("username", "Anonymous")
 
         if not user_id:
-            await websocket.send_json({"type": "error", "message": "Invalid user_id"})
+            await websocket.send_text(ERROR_FRAMES["Invalid user_id"])
             await websocket.close()
             return
 
         # Register user in room
-        user = User(user_id=user_id, username=username, websocket=websocket)
-        room.users[user_id] = user
+        room.add_user(user_id, username, websocket)
         room.touch()
 
         # Send current room state
-        await websocket.send_json({
+        await send_message(websocket, {
             "type": "room_state",
             "users": room.user_list(),
             "playback_state": room.playback_state,
             "current_video": room.current_video,
             "host_id": room.host_id,
-            "videos": {
-                vid: {"filename": meta["filename"], "size": meta["size"]}
-                for vid, meta in room.videos.items()
-            },
+            "videos": room.video_list(),
         })
 
         # Notify others that user joined
@@ -544,9 +848,12 @@ async def websocket_endpoint(websocket: WebSocket, room_code: str):
 
         # Main message loop
         while True:
-            data = await websocket.receive_json()
+            data = await receive_message(websocket)
             msg_type = data.get("type")
             room.touch()
+            # Peers must see a coalesced seek before anything sent after it
+            if pending_seek is not None and msg_type != "seek":
+                await flush_seek()
 
             if msg_type == "play":
                 room.playback_state["playing"] = True
@@ -573,12 +880,16 @@ async def websocket_endpoint(websocket: WebSocket, room_code: str):
             elif msg_type == "seek":
                 room.playback_state["position"] = data.get("position", 0.0)
                 room.playback_state["timestamp"] = time.time()
-                await broadcast(room, {
+                # Coalesce scrubbing: the latest position replaces a pending
+                # one and goes out when the (not restarted) timer fires
+                pending_seek = {
                     "type": "seek",
                     "position": room.playback_state["position"],
                     "user": username,
                     "timestamp": room.playback_state["timestamp"],
-                }, exclude_id=user_id)
+                }
+                if seek_timer is None:
+                    seek_timer = asyncio.get_running_loop().call_later(SEEK_COALESCE_SECONDS, on_seek_timer)
 
             elif msg_type == "speed":
                 speed = data.get("speed", 1.0)
@@ -598,7 +909,7 @@ async def websocket_endpoint(websocket: WebSocket, room_code: str):
                     room.playback_state["position"] = 0.0
                     room.playback_state["timestamp"] = time.time()
                     room.pending_video = video_id
-                    room.ready_users = {user_id}  # Sharer is already ready
+                    room.reset_ready(user_id)  # Sharer is already ready
                     # Tell all OTHER users to prepare this video
                     await broadcast(room, {
                         "type": "prepare_video",
@@ -608,16 +919,16 @@ async def websocket_endpoint(websocket: WebSocket, room_code: str):
                         "timestamp": room.playback_state["timestamp"],
                     }, exclude_id=user_id)
                     # Check if sharer is the only user — start immediately
-                    if len(room.users) <= 1:
+                    if room.user_count <= 1:
                         room.pending_video = None
                         room.playback_state["playing"] = True
                         room.playback_state["timestamp"] = time.time()
-                        await websocket.send_json({
+                        await send_message(websocket, {
                             "type": "all_ready",
                             "video_id": video_id,
                         })
                     else:
-                        log.info(f"Ready-sync started for {video_id} in room {room_code} (1/{len(room.users)} ready)")
+                        log.info(f"Ready-sync started for {video_id} in room {room_code} (1/{room.user_count} ready)")
                         # Timeout: force start after 30 seconds if not everyone is ready
                         asyncio.create_task(_ready_timeout(room, video_id, 30.0))
 
@@ -625,9 +936,9 @@ async def websocket_endpoint(websocket: WebSocket, room_code: str):
                 # User finished downloading and is ready to play
                 ready_video_id = data.get("video_id")
                 if room.pending_video and ready_video_id == room.pending_video:
-                    room.ready_users.add(user_id)
-                    total = len(room.users)
-                    ready_count = len(room.ready_users & set(room.users.keys()))
+                    room.mark_ready(user_id)
+                    total = room.user_count
+                    ready_count = room.ready_count
                     log.info(f"Ready-sync: {ready_count}/{total} for {ready_video_id} in room {room_code}")
                     # Broadcast progress to everyone
                     await broadcast(room, {
@@ -637,7 +948,7 @@ async def websocket_endpoint(websocket: WebSocket, room_code: str):
                         "total": total,
                     })
                     # All users ready? Start playback!
-                    if ready_count >= total:
+                    if room.all_ready:
                         room.pending_video = None
                         room.playback_state["playing"] = True
                         room.playback_state["position"] = 0.0
@@ -651,24 +962,24 @@ async def websocket_endpoint(websocket: WebSocket, room_code: str):
             elif msg_type == "kick":
                 # Only the host can kick users
                 if user_id != room.host_id:
-                    await websocket.send_json({"type": "error", "message": "Only the host can kick users"})
+                    await websocket.send_text(ERROR_FRAMES["Only the host can kick users"])
                     continue
                 target_id = data.get("target_user_id")
                 if not target_id or target_id == user_id:
                     continue
-                target_user = room.users.get(target_id)
-                if target_user:
-                    target_name = target_user.username
+                target_ws = room.websocket_of(target_id)
+                if target_ws:
+                    target_name = room.username_of(target_id)
                     # Close the target's WebSocket
                     try:
-                        await target_user.websocket.send_json({
+                        await send_message(target_ws, {
                             "type": "kicked",
                             "message": f"You were kicked by {username}",
                         })
-                        await target_user.websocket.close(1000, "Kicked by host")
+                        await target_ws.close(1000, "Kicked by host")
                     except Exception:
                         pass
-                    room.users.pop(target_id, None)
+                    room.remove_user(target_id)
                     log.info(f"Host '{username}' kicked '{target_name}' from room {room_code}")
                     # Notify remaining users
                     await broadcast(room, {
@@ -681,7 +992,7 @@ async def websocket_endpoint(websocket: WebSocket, room_code: str):
             elif msg_type == "set_shared_pool":
                 # Only the host can toggle shared pool
                 if user_id != room.host_id:
-                    await websocket.send_json({"type": "error", "message": "Only the host can change pool mode"})
+                    await websocket.send_text(ERROR_FRAMES["Only the host can change pool mode"])
                     continue
                 room.shared_pool = data.get("enabled", False)
                 await broadcast(room, {
@@ -693,13 +1004,12 @@ async def websocket_endpoint(websocket: WebSocket, room_code: str):
 
             elif msg_type == "request_random":
                 # In shared pool mode, pick a random user to provide a clip
-                if room.shared_pool and len(room.users) > 0:
+                if room.shared_pool and room.user_count > 0:
                     # Pick a random user from the room
-                    target_uid = random.choice(list(room.users.keys()))
-                    target = room.users.get(target_uid)
+                    target = random.choice(room.websockets())
                     if target:
                         try:
-                            await target.websocket.send_json({
+                            await send_message(target, {
                                 "type": "provide_random_clip",
                                 "requested_by": username,
                             })
@@ -707,13 +1017,13 @@ async def websocket_endpoint(websocket: WebSocket, room_code: str):
                             pass
                 else:
                     # Not in shared pool mode — just tell the requester to play their own
-                    await websocket.send_json({
+                    await send_message(websocket, {
                         "type": "provide_random_clip",
                         "requested_by": username,
                     })
 
             elif msg_type == "ping":
-                await websocket.send_json({"type": "pong"})
+                await websocket.send_text(PONG_FRAME)
 
     except WebSocketDisconnect:
         pass
@@ -722,11 +1032,14 @@ async def websocket_endpoint(websocket: WebSocket, room_code: str):
     except Exception as e:
         log.error(f"WebSocket error in room {room_code}: {e}")
     finally:
+        # Deliver the user's last seek before they are removed from the room
+        if seek_task is not None:
+            await seek_task
+        await flush_seek()
         # Clean up user
         if user_id and room_code in state.rooms:
             room = state.rooms[room_code]
-            leaving_user = room.users.pop(user_id, None)
-            username = leaving_user.username if leaving_user else "Unknown"
+            username = room.remove_user(user_id) or "Unknown"
 
             log.info(f"User '{username}' left room {room_code}")
 
@@ -739,7 +1052,7 @@ async def websocket_endpoint(websocket: WebSocket, room_code: str):
             })
 
             # If room is empty, schedule cleanup
-            if not room.users:
+            if not room.user_count:
                 log.info(f"Room {room_code} is empty, will expire after inactivity")
 
 
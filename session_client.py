@@ -7,23 +7,192 @@ All communication with the UI is via Qt signals.
 """
 
 import os
+import ssl
+import sys
+import socket
+import functools
 import json
 import time
+import heapq
+import random
+import itertools
 import threading
+import queue
 import tempfile
 import logging
 import shutil
 from pathlib import Path
+from collections import OrderedDict
 from typing import Optional
 
 from PyQt5.QtCore import QObject, pyqtSignal
 
 # Use requests for HTTP (simpler, synchronous, runs in thread)
 import requests
+from urllib3.fields import RequestField
 import websocket  # websocket-client library
 
+# orjson is optional: it parses/encodes every signaling frame several times
+# faster than the stdlib, which falls back in when it isn't installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    def _json_dumps(obj) -> str:
+        # Compact separators and raw UTF-8, matching orjson's output
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
 log = logging.getLogger("rdm-session")
 
+# Fixed-payload messages, encoded once
+_PING_FRAME = _json_dumps({"type": "ping"})
+_REQUEST_RANDOM_FRAME = _json_dumps({"type": "request_random"})
+
+# Minimum seconds between upload/download progress signals (10Hz)
+PROGRESS_EMIT_INTERVAL = 0.1
+
+# Displayed latency is an EWMA of pong samples, re-emitted only when it moves this much
+PING_EWMA_ALPHA = 0.2
+PING_EMIT_DELTA_MS = 5
+
+# Bytes read from disk per upload chunk (one socket write each)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Bytes copied from the socket to disk per download step
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Downloaded clips kept on disk per session before least-recently-used ones go
+DOWNLOAD_CACHE_MAX_BYTES = 5 * 1024 ** 3
+
+# Temp dirs left behind by killed sessions are removed after this long.
+# A live session touches its dir every DOWNLOAD_DIR_HEARTBEAT_SECONDS, so the
+# dir's mtime means "last seen alive", not "last clip downloaded"
+STALE_DOWNLOAD_DIR_SECONDS = 24 * 3600
+DOWNLOAD_DIR_HEARTBEAT_SECONDS = 3600
+DOWNLOAD_DIR_PREFIX = "rdm_session_"
+
+
+def _sweep_stale_download_dirs():
+    """Remove download dirs from earlier sessions that never got to clean up.
+
+    Dirs of sessions still running (here or in another app instance) are kept
+    fresh by _heartbeat_download_dir, so only abandoned ones pass the cutoff.
+    """
+    cutoff = time.time() - STALE_DOWNLOAD_DIR_SECONDS
+    try:
+        for entry in Path(tempfile.gettempdir()).glob(f"{DOWNLOAD_DIR_PREFIX}*"):
+            if entry.is_dir() and entry.stat().st_mtime < cutoff:
+                shutil.rmtree(entry, ignore_errors=True)
+    except OSError as e:
+        log.warning(f"Stale download dir sweep failed: {e}")
+
+
+class _ProgressSink:
+    """File wrapper for shutil.copyfileobj that emits throttled progress as it writes."""
+
+    def __init__(self, f, signal, total: int):
+        self._f = f
+        self._signal = signal
+        self._total = total
+        self.written = 0
+        self._last_emit = 0.0
+
+    def write(self, data) -> int:
+        self._f.write(data)
+        self.written += len(data)
+        now = time.monotonic()
+        if now - self._last_emit >= PROGRESS_EMIT_INTERVAL:
+            self._signal.emit(self.written, self._total)
+            self._last_emit = now
+        return len(data)
+
+
+@functools.lru_cache(maxsize=1)
+def _ssl_context() -> ssl.SSLContext:
+    """One TLS context (CA bundle loaded once) shared by every wss:// connect."""
+    return ssl.create_default_context()
+
+
+# ============================================================================
+# Timed Callbacks
+# ============================================================================
+
+class ScheduledCall:
+    """Handle for a callback queued on the scheduler; cancel() before it runs."""
+    __slots__ = ("callback", "cancelled")
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class _Scheduler:
+    """
+    Runs delayed callbacks on one long-lived daemon thread.
+
+    Pings and reconnect retries used to start a fresh threading.Timer (an
+    OS thread) for every tick. Callbacks run on the scheduler thread, so
+    they must not block for long.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._queue: list = []  # (due monotonic time, seq, ScheduledCall)
+        self._seq = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+
+    def call_later(self, delay: float, callback) -> ScheduledCall:
+        call = ScheduledCall(callback)
+        with self._cond:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="rdm-scheduler", daemon=True)
+                self._thread.start()
+            heapq.heappush(self._queue, (time.monotonic() + delay, next(self._seq), call))
+            self._cond.notify()
+        return call
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if not self._queue:
+                        self._cond.wait()
+                        continue
+                    due, _, call = self._queue[0]
+                    wait = due - time.monotonic()
+                    if wait > 0:
+                        self._cond.wait(wait)
+                        continue
+                    heapq.heappop(self._queue)
+                    if not call.cancelled:
+                        break
+            try:
+                call.callback()
+            except Exception as e:
+                log.error(f"Scheduled callback failed: {e}")
+
+
+_scheduler = _Scheduler()
+
+
+def _heartbeat_download_dir(path: Path):
+    """Touch a live session's download dir so other instances' sweeps skip it.
+
+    Takes only the path, so the scheduler never keeps a SessionClient alive;
+    the heartbeat stops once the dir has been removed.
+    """
+    try:
+        os.utime(path)
+    except OSError:
+        return
+    _scheduler.call_later(DOWNLOAD_DIR_HEARTBEAT_SECONDS, lambda: _heartbeat_download_dir(path))
+
 # ============================================================================
 # Session Client Signals (thread-safe communication with UI)
 # ============================================================================
@@ -112,25 +281,71 @@ class SessionClient:
         self._username: Optional[str] = None
         self._host_id: Optional[str] = None
 
+        # One keep-alive connection pool for every REST call, upload and download
+        self._http = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+
         self._ws: Optional[websocket.WebSocketApp] = None
+        # Server message type -> handler, built once instead of an if/elif chain per frame
+        self._ws_handlers = {
+            "room_state": self._handle_room_state,
+            "user_joined": self._handle_user_joined,
+            "user_left": self._handle_user_left,
+            "kicked": self._handle_kicked,
+            "user_kicked": self._handle_user_kicked,
+            "play": self._handle_play,
+            "pause": self._handle_pause,
+            "seek": self._handle_seek,
+            "speed": self._handle_speed,
+            "play_video": self._handle_play_video,
+            "prepare_video": self._handle_prepare_video,
+            "all_ready": self._handle_all_ready,
+            "ready_progress": self._handle_ready_progress,
+            "video_uploaded": self._handle_video_uploaded,
+            "pong": self._handle_pong,
+            "provide_random_clip": self._handle_provide_random_clip,
+            "shared_pool_changed": self._handle_shared_pool_changed,
+            "error": self._handle_error,
+        }
         self._ws_thread: Optional[threading.Thread] = None
-        self._connected = False
+        # Set on the WebSocket thread, read from the UI thread
+        self._connected = threading.Event()
         self._shutting_down = False
 
+        # Outgoing frames are written by one thread so callers never block on
+        # the socket (started on first connect, reused across reconnects)
+        self._send_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer_thread: Optional[threading.Thread] = None
+
         # Temp directory for downloaded videos
-        self._download_dir = Path(tempfile.mkdtemp(prefix="rdm_session_"))
+        self._download_dir = Path(tempfile.mkdtemp(prefix=DOWNLOAD_DIR_PREFIX))
+        _scheduler.call_later(DOWNLOAD_DIR_HEARTBEAT_SECONDS,
+                              lambda path=self._download_dir: _heartbeat_download_dir(path))
+        threading.Thread(target=_sweep_stale_download_dirs, daemon=True).start()
+
+        # Downloaded clips in least- to most-recently-used order
+        # (video_id -> (local_path, size)); uploads point at the user's own
+        # files and are never tracked or evicted
+        self._downloaded: OrderedDict = OrderedDict()
+        self._downloaded_bytes = 0
+        self._download_lock = threading.Lock()
+        self._downloads_in_flight: set = set()  # video_ids with a download thread running
 
         # Track available videos
         self._videos: dict = {}  # video_id -> metadata
 
         # Ping measurement
         self._ping_sent_at: float = 0.0
-        self._ping_timer: Optional[threading.Timer] = None
+        self._ping_timer: Optional[ScheduledCall] = None
+        self._ping_ewma: Optional[float] = None
+        self._ping_emitted: Optional[int] = None
 
         # Auto-reconnect state
         self._reconnect_attempts = 0
         self._max_reconnect_attempts = 5
-        self._reconnect_timer: Optional[threading.Timer] = None
+        self._reconnect_timer: Optional[ScheduledCall] = None
         self._last_password: Optional[str] = None  # Saved for reconnect
 
     # ====================================================================
@@ -139,7 +354,7 @@ class SessionClient:
 
     @property
     def is_connected(self) -> bool:
-        return self._connected
+        return self._connected.is_set()
 
     @property
     def room_code(self) -> Optional[str]:
@@ -165,7 +380,7 @@ class SessionClient:
         """Test if a server is reachable. Returns (success, message)."""
         try:
             url = self._normalize_url(server_url)
-            resp = requests.get(f"{url}/health", timeout=5)
+            resp = self._http.get(f"{url}/health", timeout=5)
             if resp.status_code == 200:
                 data = resp.json()
                 return True, f"Server OK — {data.get('rooms', 0)} active rooms"
@@ -212,13 +427,18 @@ class SessionClient:
                 self._ws.close()
             except Exception:
                 pass
-        self._connected = False
+        self._connected.clear()
+        # Stop the writer: its bound-method target would otherwise keep this
+        # client (session, socket) alive blocked on the queue
+        if self._writer_thread:
+            self._send_queue.put(None)
+            self._writer_thread = None
         self._room_code = None
         self._user_id = None
         self._videos.clear()
-        self.cleanup()
+        self._remove_download_dir()
 
-    def cleanup(self):
+    def _remove_download_dir(self):
         """Clean up temporary downloaded files."""
         try:
             if self._download_dir.exists():
@@ -227,7 +447,7 @@ class SessionClient:
             log.error(f"Failed to clean up temp dir: {e}")
 
     def __del__(self):
-        self.cleanup()
+        self._remove_download_dir()
 
     # ====================================================================
     # Send Playback Events
@@ -240,6 +460,9 @@ class SessionClient:
         self._send({"type": "pause", "position": position})
 
     def send_seek(self, position: float):
+        # Sent as-is: the player already coalesces scrubbing into one seek per
+        # 50ms (VideoPlayer._session_send_seek), and the server coalesces again
+        # before broadcasting — a third debounce here would only add latency
         self._send({"type": "seek", "position": position})
 
     def send_speed(self, speed: float):
@@ -253,7 +476,7 @@ class SessionClient:
 
     def send_request_random(self):
         """Request the server to pick a random user to play their next clip."""
-        self._send({"type": "request_random"})
+        self._send_frame(_REQUEST_RANDOM_FRAME)
 
     def send_ready(self, video_id: str):
         """Tell the server we've downloaded this video and are ready to play."""
@@ -266,17 +489,15 @@ class SessionClient:
     def send_ping(self):
         """Send a ping to measure round-trip latency."""
         self._ping_sent_at = time.monotonic()
-        self._send({"type": "ping"})
+        self._send_frame(_PING_FRAME)
 
     def start_ping_loop(self, interval: float = 5.0):
         """Start a repeating ping every `interval` seconds."""
         self.stop_ping_loop()
         def _loop():
-            if self._connected and not self._shutting_down:
+            if self._connected.is_set() and not self._shutting_down:
                 self.send_ping()
-                self._ping_timer = threading.Timer(interval, _loop)
-                self._ping_timer.daemon = True
-                self._ping_timer.start()
+                self._ping_timer = _scheduler.call_later(interval, _loop)
         _loop()
 
     def stop_ping_loop(self):
@@ -290,23 +511,27 @@ class SessionClient:
     # ====================================================================
 
     def _attempt_reconnect(self):
-        """Try to reconnect to the room with exponential backoff."""
+        """Try to reconnect to the room with jittered exponential backoff."""
         self._reconnect_attempts += 1
-        delay = min(2 ** self._reconnect_attempts, 30)  # 2s, 4s, 8s, 16s, 30s
-        log.info(f"Reconnecting in {delay}s (attempt {self._reconnect_attempts}/{self._max_reconnect_attempts})")
+        # Full jitter over a 2s, 4s, 8s, 16s, 30s window so clients dropped by a
+        # server restart don't all hit /join at the same instant
+        cap = min(2 ** self._reconnect_attempts, 30)
+        delay = random.uniform(min(1.0, cap), cap)
+        log.info(f"Reconnecting in {delay:.1f}s (attempt {self._reconnect_attempts}/{self._max_reconnect_attempts})")
         self.signals.connection_error.emit(
-            f"Connection lost — reconnecting in {delay}s ({self._reconnect_attempts}/{self._max_reconnect_attempts})"
+            f"Connection lost — reconnecting in {delay:.0f}s ({self._reconnect_attempts}/{self._max_reconnect_attempts})"
+        )
+        # The scheduler thread is shared, so the blocking /join runs on its own thread
+        self._reconnect_timer = _scheduler.call_later(
+            delay, lambda: threading.Thread(target=self._reconnect_thread, daemon=True).start()
         )
-        self._reconnect_timer = threading.Timer(delay, self._reconnect_thread)
-        self._reconnect_timer.daemon = True
-        self._reconnect_timer.start()
 
     def _reconnect_thread(self):
         """Re-join the room and reconnect WebSocket."""
         if self._shutting_down:
             return
         try:
-            resp = requests.post(
+            resp = self._http.post(
                 f"{self._server_url}/rooms/{self._room_code}/join",
                 json={"password": self._last_password or "", "username": self._username},
                 timeout=10,
@@ -340,6 +565,10 @@ class SessionClient:
     # Video Upload / Download
     # ====================================================================
 
+    # Each transfer runs on its own daemon thread over the shared keep-alive
+    # Session: requests is blocking, and daemon threads (unlike executor
+    # workers) never hold up app exit in the middle of a long transfer.
+
     def upload_and_play(self, filepath: str):
         """Upload a local video to the server and tell the room to play it."""
         threading.Thread(
@@ -349,7 +578,17 @@ class SessionClient:
         ).start()
 
     def download_video(self, video_id: str):
-        """Download a video from the server to a local temp file."""
+        """Download a video from the server to a local temp file.
+
+        Duplicate requests while a download of the same clip is running are
+        dropped; that download's video_ready signal answers all of them.
+        """
+        # room_state, play_video and prepare_video can all ask for the same
+        # clip back-to-back; one transfer per clip, the running one reports ready
+        with self._download_lock:
+            if video_id in self._downloads_in_flight:
+                return
+            self._downloads_in_flight.add(video_id)
         threading.Thread(
             target=self._download_thread,
             args=(video_id,),
@@ -357,14 +596,49 @@ class SessionClient:
         ).start()
 
     def get_local_video_path(self, video_id: str) -> Optional[str]:
-        """Get the local path of a previously downloaded video, or None."""
+        """Get the local path of a previously downloaded video, or None.
+
+        local_path_exists is set once the file has been fully written (or,
+        for our own uploads, was read from disk), so no stat() is done here;
+        _download_thread re-checks the file before trusting it.
+        """
         meta = self._videos.get(video_id)
-        if meta and meta.get("local_path"):
-            path = meta["local_path"]
-            if os.path.exists(path):
-                return path
+        if meta and meta.get("local_path_exists"):
+            with self._download_lock:
+                if video_id in self._downloaded:
+                    self._downloaded.move_to_end(video_id)
+            return meta.get("local_path")
         return None
 
+    def _track_download(self, video_id: str, local_path: str):
+        """Record a finished download, then evict least-recently-used clips over the cap."""
+        size = os.path.getsize(local_path)
+        with self._download_lock:
+            _, old_size = self._downloaded.pop(video_id, (None, 0))
+            self._downloaded[video_id] = (local_path, size)
+            self._downloaded_bytes += size - old_size
+            for old_id, (old_path, old_size) in list(self._downloaded.items()):
+                if self._downloaded_bytes <= DOWNLOAD_CACHE_MAX_BYTES or old_id == video_id:
+                    break
+                try:
+                    os.remove(old_path)
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    continue  # Still open (e.g. playing on Windows) — try again next time
+                if old_id in self._videos:
+                    self._videos[old_id]["local_path_exists"] = False
+                del self._downloaded[old_id]
+                self._downloaded_bytes -= old_size
+
+    def _forget_download(self, video_id: str):
+        """Drop a downloaded clip whose file has gone missing, so it is fetched again."""
+        with self._download_lock:
+            _, size = self._downloaded.pop(video_id, (None, 0))
+            self._downloaded_bytes -= size
+        if video_id in self._videos:
+            self._videos[video_id]["local_path_exists"] = False
+
     # ====================================================================
     # Internal: Room Creation/Joining
     # ====================================================================
@@ -384,7 +658,7 @@ class SessionClient:
             self._server_url = url
             self._username = username
 
-            resp = requests.post(
+            resp = self._http.post(
                 f"{url}/rooms",
                 json={"password": password, "username": username},
                 timeout=10,
@@ -416,7 +690,7 @@ class SessionClient:
             self._server_url = url
             self._username = username
 
-            resp = requests.post(
+            resp = self._http.post(
                 f"{url}/rooms/{room_code}/join",
                 json={"password": password, "username": username},
                 timeout=10,
@@ -440,9 +714,7 @@ class SessionClient:
             self._room_code = data["room_code"]
             self._user_id = data["user_id"]
             self._host_id = data["host_id"]
-            self._videos = {
-                vid: meta for vid, meta in data.get("videos", {}).items()
-            }
+            self._videos = dict(data.get("videos", {}))
 
             self.signals.room_joined.emit(data)
 
@@ -470,160 +742,178 @@ class SessionClient:
             on_close=self._on_ws_close,
         )
 
-        # Run in its own thread
+        # Run in its own thread. Playback events are tiny frames that must not
+        # sit in Nagle's buffer; websocket-client sets TCP_NODELAY by default,
+        # this keeps it pinned regardless of library version.
+        run_kwargs = {
+            "ping_interval": 30,
+            "ping_timeout": 10,
+            "sockopt": ((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),),
+        }
+        if ws_url.startswith("wss://"):
+            # Reuse the loaded CA bundle instead of rebuilding a context per (re)connect
+            run_kwargs["sslopt"] = {"context": _ssl_context()}
         self._ws_thread = threading.Thread(
             target=self._ws.run_forever,
-            kwargs={"ping_interval": 30, "ping_timeout": 10},
+            kwargs=run_kwargs,
             daemon=True,
         )
         self._ws_thread.start()
 
     def _on_ws_open(self, ws):
         """Send auth message on connect."""
-        ws.send(json.dumps({
+        ws.send(_json_dumps({
             "type": "auth",
             "user_id": self._user_id,
             "username": self._username,
         }))
-        self._connected = True
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(target=self._writer_loop, name="rdm-ws-writer", daemon=True)
+            self._writer_thread.start()
+        self._connected.set()
+        self._ping_ewma = self._ping_emitted = None  # Fresh connection, fresh latency
         self.signals.connected.emit()
         self.start_ping_loop()
 
     def _on_ws_message(self, ws, message):
         """Handle incoming WebSocket messages."""
         try:
-            data = json.loads(message)
-            msg_type = data.get("type")
-
-            if msg_type == "room_state":
-                self.signals.room_joined.emit(data)
-                # Sync-on-join: if there's an active video, trigger download + sync
-                current_vid = data.get("current_video")
-                if current_vid:
-                    videos = data.get("videos", {})
-                    vid_meta = videos.get(current_vid, {})
-                    filename = vid_meta.get("filename", f"{current_vid}.mp4")
-                    self._videos.update({
-                        vid: meta for vid, meta in videos.items()
-                    })
-                    playback = data.get("playback_state", {})
-                    self.signals.sync_to_video.emit(current_vid, filename, playback)
-                    self.download_video(current_vid)
-
-            elif msg_type == "user_joined":
-                self.signals.user_joined.emit(
-                    data.get("username", ""),
-                    data.get("users", []),
-                )
-
-            elif msg_type == "user_left":
-                self.signals.user_left.emit(
-                    data.get("username", ""),
-                    data.get("users", []),
-                )
-
-            elif msg_type == "kicked":
-                # We were kicked from the room
-                self._connected = False
-                self.signals.kicked.emit(data.get("message", "Kicked from room"))
-
-            elif msg_type == "user_kicked":
-                self.signals.user_kicked.emit(
-                    data.get("username", ""),
-                    data.get("kicked_by", ""),
-                    data.get("users", []),
-                )
-
-            elif msg_type == "play":
-                self.signals.remote_play.emit(
-                    data.get("position", 0.0),
-                    data.get("user", ""),
-                )
-
-            elif msg_type == "pause":
-                self.signals.remote_pause.emit(
-                    data.get("position", 0.0),
-                    data.get("user", ""),
-                )
-
-            elif msg_type == "seek":
-                self.signals.remote_seek.emit(
-                    data.get("position", 0.0),
-                    data.get("user", ""),
-                )
-
-            elif msg_type == "speed":
-                self.signals.remote_speed.emit(
-                    data.get("speed", 1.0),
-                    data.get("user", ""),
-                )
-
-            elif msg_type == "play_video":
-                video_id = data.get("video_id", "")
-                filename = data.get("filename", "")
-                user = data.get("user", "")
-                self.signals.remote_play_video.emit(video_id, filename, user)
-                # Auto-download the video
-                self.download_video(video_id)
-
-            elif msg_type == "prepare_video":
-                # New ready-sync: download the video, then report ready
-                video_id = data.get("video_id", "")
-                filename = data.get("filename", "")
-                user = data.get("user", "")
-                self.signals.prepare_video.emit(video_id, filename, user)
-                # Auto-download — when done, video_ready signal fires → UI sends ready
-                self.download_video(video_id)
-
-            elif msg_type == "all_ready":
-                # Everyone has downloaded — start playback
-                video_id = data.get("video_id", "")
-                self.signals.all_ready.emit(video_id)
-
-            elif msg_type == "ready_progress":
-                ready_count = data.get("ready", 0)
-                total = data.get("total", 0)
-                self.signals.ready_progress.emit(ready_count, total)
-
-            elif msg_type == "video_uploaded":
-                video_id = data.get("video_id", "")
-                filename = data.get("filename", "")
-                size = data.get("size", 0)
-                uploader = data.get("uploaded_by", "")
-                self._videos[video_id] = {"filename": filename, "size": size}
-                self.signals.video_uploaded.emit(video_id, filename, size, uploader)
-
-            elif msg_type == "pong":
-                if self._ping_sent_at > 0:
-                    latency_ms = int((time.monotonic() - self._ping_sent_at) * 1000)
-                    self._ping_sent_at = 0.0
-                    self.signals.ping_result.emit(latency_ms)
-
-            elif msg_type == "provide_random_clip":
-                # Server picked us to share a random clip
-                self.signals.random_clip_requested.emit()
-
-            elif msg_type == "shared_pool_changed":
-                self.signals.shared_pool_changed.emit(
-                    data.get("enabled", False),
-                    data.get("changed_by", ""),
-                )
-
-            elif msg_type == "error":
-                self.signals.room_error.emit(data.get("message", "Unknown error"))
-
+            data = _json_loads(message)
+            handler = self._ws_handlers.get(data.get("type"))
+            if handler:
+                handler(data)
         except json.JSONDecodeError:
             log.warning(f"Invalid JSON from server: {message[:100]}")
         except Exception as e:
             log.error(f"Error handling WS message: {e}")
 
+    def _handle_room_state(self, data: dict):
+        self.signals.room_joined.emit(data)
+        # Sync-on-join: if there's an active video, trigger download + sync
+        current_vid = data.get("current_video")
+        if current_vid:
+            videos = data.get("videos", {})
+            vid_meta = videos.get(current_vid, {})
+            filename = vid_meta.get("filename", f"{current_vid}.mp4")
+            self._videos.update(videos)
+            playback = data.get("playback_state", {})
+            self.signals.sync_to_video.emit(current_vid, filename, playback)
+            self.download_video(current_vid)
+
+    def _handle_user_joined(self, data: dict):
+        self.signals.user_joined.emit(
+            sys.intern(data.get("username") or ""),
+            data.get("users", []),
+        )
+
+    def _handle_user_left(self, data: dict):
+        self.signals.user_left.emit(
+            sys.intern(data.get("username") or ""),
+            data.get("users", []),
+        )
+
+    def _handle_kicked(self, data: dict):
+        # We were kicked from the room
+        self._connected.clear()
+        self.signals.kicked.emit(data.get("message", "Kicked from room"))
+
+    def _handle_user_kicked(self, data: dict):
+        self.signals.user_kicked.emit(
+            sys.intern(data.get("username") or ""),
+            sys.intern(data.get("kicked_by") or ""),
+            data.get("users", []),
+        )
+
+    def _handle_play(self, data: dict):
+        self.signals.remote_play.emit(
+            data.get("position", 0.0),
+            sys.intern(data.get("user") or ""),
+        )
+
+    def _handle_pause(self, data: dict):
+        self.signals.remote_pause.emit(
+            data.get("position", 0.0),
+            sys.intern(data.get("user") or ""),
+        )
+
+    def _handle_seek(self, data: dict):
+        self.signals.remote_seek.emit(
+            data.get("position", 0.0),
+            sys.intern(data.get("user") or ""),
+        )
+
+    def _handle_speed(self, data: dict):
+        self.signals.remote_speed.emit(
+            data.get("speed", 1.0),
+            sys.intern(data.get("user") or ""),
+        )
+
+    def _handle_play_video(self, data: dict):
+        video_id = data.get("video_id", "")
+        filename = data.get("filename", "")
+        user = sys.intern(data.get("user") or "")
+        self.signals.remote_play_video.emit(video_id, filename, user)
+        # Auto-download the video
+        self.download_video(video_id)
+
+    def _handle_prepare_video(self, data: dict):
+        # New ready-sync: download the video, then report ready
+        video_id = data.get("video_id", "")
+        filename = data.get("filename", "")
+        user = sys.intern(data.get("user") or "")
+        self.signals.prepare_video.emit(video_id, filename, user)
+        # Auto-download — when done, video_ready signal fires → UI sends ready
+        self.download_video(video_id)
+
+    def _handle_all_ready(self, data: dict):
+        # Everyone has downloaded — start playback
+        self.signals.all_ready.emit(data.get("video_id", ""))
+
+    def _handle_ready_progress(self, data: dict):
+        self.signals.ready_progress.emit(data.get("ready", 0), data.get("total", 0))
+
+    def _handle_video_uploaded(self, data: dict):
+        video_id = data.get("video_id", "")
+        filename = data.get("filename", "")
+        size = data.get("size", 0)
+        uploader = data.get("uploaded_by", "")
+        self._videos[video_id] = {"filename": filename, "size": size}
+        self.signals.video_uploaded.emit(video_id, filename, size, uploader)
+
+    def _handle_pong(self, data: dict):
+        if self._ping_sent_at > 0:
+            sample = (time.monotonic() - self._ping_sent_at) * 1000
+            self._ping_sent_at = 0.0
+            if self._ping_ewma is None:
+                self._ping_ewma = sample
+            else:
+                self._ping_ewma += PING_EWMA_ALPHA * (sample - self._ping_ewma)
+            latency_ms = int(self._ping_ewma)
+            # Don't wake the UI for jitter it wouldn't visibly show
+            if self._ping_emitted is None or abs(latency_ms - self._ping_emitted) >= PING_EMIT_DELTA_MS:
+                self._ping_emitted = latency_ms
+                self.signals.ping_result.emit(latency_ms)
+
+    def _handle_provide_random_clip(self, data: dict):
+        # Server picked us to share a random clip
+        self.signals.random_clip_requested.emit()
+
+    def _handle_shared_pool_changed(self, data: dict):
+        self.signals.shared_pool_changed.emit(
+            data.get("enabled", False),
+            sys.intern(data.get("changed_by") or ""),
+        )
+
+    def _handle_error(self, data: dict):
+        self.signals.room_error.emit(data.get("message", "Unknown error"))
+
     def _on_ws_error(self, ws, error):
         if not self._shutting_down:
             log.error(f"WebSocket error: {error}")
             self.signals.connection_error.emit(str(error))
 
     def _on_ws_close(self, ws, close_status_code, close_msg):
-        self._connected = False
+        self._connected.clear()
         self.stop_ping_loop()
         if not self._shutting_down:
             # Try auto-reconnect before fully disconnecting
@@ -635,9 +925,23 @@ class SessionClient:
 
     def _send(self, data: dict):
         """Send a JSON message over WebSocket."""
-        if self._ws and self._connected:
+        self._send_frame(_json_dumps(data))
+
+    def _send_frame(self, frame: str):
+        """Queue an already-encoded JSON message for the writer thread."""
+        if self._ws and self._connected.is_set():
+            self._send_queue.put(frame)
+
+    def _writer_loop(self):
+        """Send queued frames in order until disconnect() posts None."""
+        while (frame := self._send_queue.get()) is not None:
+            ws = self._ws
+            if not (ws and self._connected.is_set()):
+                continue  # Dropped while disconnected, as direct sends were
             try:
-                self._ws.send(json.dumps(data))
+                ws.send(frame)
+            except websocket.WebSocketConnectionClosedException:
+                pass  # Closed between the check and the send; _on_ws_close handles it
             except Exception as e:
                 log.error(f"Failed to send WS message: {e}")
 
@@ -658,38 +962,16 @@ class SessionClient:
             # Upload with progress tracking
             url = f"{self._server_url}/rooms/{self._room_code}/upload"
 
-            # Use a generator to track upload progress (throttled to ~20 updates/sec)
-            class ProgressFile:
-                def __init__(self, path, signals, total_size):
-                    self._file = open(path, "rb")
-                    self._signals = signals
-                    self._total = total_size
-                    self._sent = 0
-                    self._last_emit = 0.0
-
-                def read(self, size=-1):
-                    data = self._file.read(size)
-                    self._sent += len(data)
-                    now = time.monotonic()
-                    if now - self._last_emit >= 0.05 or self._sent >= self._total:
-                        self._signals.upload_progress.emit(self._sent, self._total)
-                        self._last_emit = now
-                    return data
-
-                def __getattr__(self, name):
-                    return getattr(self._file, name)
-
-            progress_file = ProgressFile(filepath, self.signals, file_size)
-
-            resp = requests.post(
+            # Stream the multipart body from disk (requests' files= would read
+            # the whole clip into memory first)
+            boundary = os.urandom(16).hex()
+            resp = self._http.post(
                 url,
-                data={"user_id": self._user_id},
-                files={"file": (filename, progress_file, "application/octet-stream")},
+                data=self._multipart_upload_body(filepath, filename, file_size, boundary),
+                headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
                 timeout=600,  # 10 minute timeout for large files
             )
 
-            progress_file._file.close()
-
             if resp.status_code != 200:
                 error = resp.json().get("detail", resp.text)
                 self.signals.room_error.emit(f"Upload failed: {error}")
@@ -703,6 +985,7 @@ class SessionClient:
                 "filename": filename,
                 "size": file_size,
                 "local_path": filepath,
+                "local_path_exists": True,
             }
 
             # Tell room to play this video (server starts ready-sync)
@@ -713,14 +996,42 @@ class SessionClient:
             log.error(f"Upload error: {e}")
             self.signals.room_error.emit(f"Upload error: {e}")
 
+    def _multipart_upload_body(self, filepath: str, filename: str, file_size: int, boundary: str):
+        """Yield a multipart/form-data upload body, emitting throttled upload_progress."""
+        field = RequestField(name="file", data=b"", filename=filename)
+        field.make_multipart(content_type="application/octet-stream")
+        yield (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="user_id"\r\n\r\n{self._user_id}\r\n'
+            f"--{boundary}\r\n{field.render_headers()}"
+        ).encode()
+
+        sent = 0
+        last_emit = 0.0
+        with open(filepath, "rb") as f:
+            while chunk := f.read(UPLOAD_CHUNK_SIZE):
+                yield chunk
+                sent += len(chunk)
+                now = time.monotonic()
+                if now - last_emit >= PROGRESS_EMIT_INTERVAL:
+                    self.signals.upload_progress.emit(sent, file_size)
+                    last_emit = now
+        self.signals.upload_progress.emit(sent, file_size)
+
+        yield f"\r\n--{boundary}--\r\n".encode()
+
     def _download_thread(self, video_id: str):
         """Download a video from the server to a local temp file."""
+        part_path = None
         try:
-            # Check if already downloaded
+            # Check if already downloaded — and still on disk, since the file
+            # may have been deleted outside the app (e.g. another instance's sweep)
             existing = self.get_local_video_path(video_id)
             if existing:
-                self.signals.video_ready.emit(video_id, existing)
-                return
+                if os.path.exists(existing):
+                    self.signals.video_ready.emit(video_id, existing)
+                    return
+                self._forget_download(video_id)
 
             meta = self._videos.get(video_id, {})
             filename = meta.get("filename", f"{video_id}.mp4")
@@ -729,29 +1040,55 @@ class SessionClient:
             url = f"{self._server_url}/rooms/{self._room_code}/videos/{video_id}"
             local_path = str(self._download_dir / f"{video_id}_{filename}")
 
-            resp = requests.get(url, stream=True, timeout=600)
-            if resp.status_code not in (200, 206):
-                self.signals.room_error.emit(f"Download failed: {resp.status_code}")
-                return
-
-            received = 0
-            with open(local_path, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=262144):  # 256KB
-                    f.write(chunk)
-                    received += len(chunk)
-                    self.signals.download_progress.emit(received, total_size)
+            # A complete file from an earlier download whose metadata was since
+            # replaced (e.g. by a room_state refresh) — only finished downloads
+            # ever reach local_path, so a matching size means it's whole
+            try:
+                complete = bool(total_size) and os.path.getsize(local_path) == total_size
+            except OSError:
+                complete = False
+
+            if not complete:
+                part_path = local_path + ".part"
+                # The with block releases the streamed connection on every exit path
+                with self._http.get(url, stream=True, timeout=600) as resp:
+                    if resp.status_code not in (200, 206):
+                        self.signals.room_error.emit(f"Download failed: {resp.status_code}")
+                        return
+
+                    # Copy straight from the raw socket stream in 1MB steps; the sink
+                    # throttles progress signals and the final update always goes out.
+                    # Written to a .part file so an interrupted download is never played.
+                    resp.raw.decode_content = True
+                    with open(part_path, "wb") as f:
+                        sink = _ProgressSink(f, self.signals.download_progress, total_size)
+                        shutil.copyfileobj(resp.raw, sink, DOWNLOAD_CHUNK_SIZE)
+                os.replace(part_path, local_path)
+                part_path = None
+                self.signals.download_progress.emit(sink.written, total_size)
+
+            self._track_download(video_id, local_path)
 
             # Store local path
             if video_id in self._videos:
                 self._videos[video_id]["local_path"] = local_path
+                self._videos[video_id]["local_path_exists"] = True
             else:
-                self._videos[video_id] = {"filename": filename, "local_path": local_path}
+                self._videos[video_id] = {"filename": filename, "local_path": local_path, "local_path_exists": True}
 
             self.signals.video_ready.emit(video_id, local_path)
 
         except Exception as e:
             log.error(f"Download error: {e}")
             self.signals.room_error.emit(f"Download error: {e}")
+            if part_path:
+                try:
+                    os.remove(part_path)
+                except OSError:
+                    pass
+        finally:
+            with self._download_lock:
+                self._downloads_in_flight.discard(video_id)
 
     # ====================================================================
     # Cleanup
@@ -764,9 +1101,4 @@ class SessionClient:
             self._reconnect_timer.cancel()
             self._reconnect_timer = None
         self.disconnect()
-        try:
-            import shutil
-            if self._download_dir.exists():
-                shutil.rmtree(self._download_dir, ignore_errors=True)
-        except Exception:
-            pass
+        self._http.close()